@@ -2,9 +2,14 @@ from ._loss_functions import zero_one_loss, binary_cross_entropy_loss
 from ._visualization import plot_decision_boundary
 from ._performance_measures import *
 from ._performance_measures_II import *
+from ._streaming_measures import *
+from ._bootstrap import *
 from ._error_estimation import *
 from ._one_sample_tests import *
 from ._paired_tests import *
+from ._batched_tests import *
+from ._permutation_tests import *
+from ._model_evaluation import *
 
 __all__ = [
     "zero_one_loss",
@@ -12,7 +17,12 @@ __all__ = [
     "plot_decision_boundary",
     "_performance_measures",
     "_performance_measures_II",
+    "_streaming_measures",
+    "_bootstrap",
     "_error_estimation",
     "_one_sample_tests",
-    "_paired_tests"
+    "_paired_tests",
+    "_batched_tests",
+    "_permutation_tests",
+    "_model_evaluation"
 ]
\ No newline at end of file
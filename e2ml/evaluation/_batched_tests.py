@@ -0,0 +1,234 @@
+import numpy as np
+
+from sklearn.utils.validation import check_array, check_scalar
+from scipy import stats
+
+from ._paired_tests import _signed_rank_distribution
+
+
+def z_test_one_sample_batch(sample_data, mu_0, sigma, test_type="two-sided"):
+    """Perform one-sample z-tests for a batch of samples at once.
+
+    Parameters
+    ----------
+    sample_data : array-like of shape (n_tests, n_samples)
+        Sample data, where each row is drawn from a population.
+    mu_0 : float or array-like of shape (n_tests,)
+        Population means assumed by the null hypotheses.
+    sigma: float or array-like of shape (n_tests,)
+        True population standard deviations.
+    test_type : {'right-tail', 'left-tail', 'two-sided'}
+        Specifies the type of test for computing the p-values.
+
+    Returns
+    -------
+    z_statistics : numpy.ndarray of shape (n_tests,)
+        Observed z-transformed test statistics.
+    p : numpy.ndarray of shape (n_tests,)
+        p-values for the observed sample data.
+    """
+    # Check parameters.
+    sample_data = check_array(sample_data)
+    mu_0 = _check_batch_param(mu_0, "mu_0", len(sample_data))
+    sigma = _check_batch_param(sigma, "sigma", len(sample_data))
+    if np.any(sigma <= 0):
+        raise ValueError("`sigma` must be positive.")
+    _check_test_type(test_type)
+
+    z_statistics = (np.mean(sample_data, axis=1) - mu_0) / (sigma / np.sqrt(sample_data.shape[1]))
+    return z_statistics, _p_values(stats.norm.cdf(z_statistics), stats.norm.sf(z_statistics), test_type)
+
+
+def t_test_one_sample_batch(sample_data, mu_0, test_type="two-sided"):
+    """Perform one-sample t-tests for a batch of samples at once.
+
+    Parameters
+    ----------
+    sample_data : array-like of shape (n_tests, n_samples)
+        Sample data, where each row is drawn from a population.
+    mu_0 : float or array-like of shape (n_tests,)
+        Population means assumed by the null hypotheses.
+    test_type : {'right-tail', 'left-tail', 'two-sided'}
+        Specifies the type of test for computing the p-values.
+
+    Returns
+    -------
+    t_statistics : numpy.ndarray of shape (n_tests,)
+        Observed t-transformed test statistics.
+    p : numpy.ndarray of shape (n_tests,)
+        p-values for the observed sample data.
+    """
+    # Check parameters.
+    sample_data = check_array(sample_data, ensure_min_features=2)
+    mu_0 = _check_batch_param(mu_0, "mu_0", len(sample_data))
+    _check_test_type(test_type)
+
+    sample_size = sample_data.shape[1]
+    empirical_std = np.std(sample_data, axis=1, ddof=1)
+    t_statistics = (np.mean(sample_data, axis=1) - mu_0) / (empirical_std / np.sqrt(sample_size))
+    p_left = stats.t.cdf(t_statistics, df=sample_size - 1)
+    p_right = stats.t.sf(t_statistics, df=sample_size - 1)
+    return t_statistics, _p_values(p_left, p_right, test_type)
+
+
+def t_test_paired_batch(sample_data_1, sample_data_2=None, mu_0=0, test_type="two-sided"):
+    """Perform paired t-tests for a batch of paired samples at once.
+
+    Parameters
+    ----------
+    sample_data_1 : array-like of shape (n_tests, n_samples)
+        Sample data drawn from populations 1. If no sample data is given, `sample_data_1` is assumed to consist of
+        differences.
+    sample_data_2 : array-like of shape (n_tests, n_samples), optional (default=None)
+        Sample data drawn from populations 2.
+    mu_0 : float or array-like of shape (n_tests,)
+        Population means assumed by the null hypotheses.
+    test_type : {'right-tail', 'left-tail', 'two-sided'}
+        Specifies the type of test for computing the p-values.
+
+    Returns
+    -------
+    t_statistics : numpy.ndarray of shape (n_tests,)
+        Observed t-transformed test statistics.
+    p : numpy.ndarray of shape (n_tests,)
+        p-values for the observed sample data.
+    """
+    return t_test_one_sample_batch(_differences(sample_data_1, sample_data_2), mu_0=mu_0, test_type=test_type)
+
+
+def wilcoxon_signed_rank_test_batch(sample_data_1, sample_data_2=None, test_type="two-sided", max_exact_size=30):
+    """Perform Wilcoxon signed-rank tests for a batch of paired samples at once.
+
+    Parameters
+    ----------
+    sample_data_1 : array-like of shape (n_tests, n_samples)
+        Sample data drawn from populations 1. If no sample data is given, `sample_data_1` is assumed to consist of
+        differences.
+    sample_data_2 : array-like of shape (n_tests, n_samples), optional (default=None)
+        Sample data drawn from populations 2.
+    test_type : {'right-tail', 'left-tail', 'two-sided'}
+        Specifies the type of test for computing the p-values.
+    max_exact_size : int, default=30
+        Maximum number of non-zero differences of a test for which the p-value is computed from the exact sampling
+        distribution, see `wilcoxon_signed_rank_test`.
+
+    Returns
+    -------
+    w_statistics : numpy.ndarray of shape (n_tests,)
+        Observed positive rank sums as test statistics.
+    p : numpy.ndarray of shape (n_tests,)
+        p-values for the observed sample data.
+    """
+    # Check parameters.
+    sample_data_diff = _differences(sample_data_1, sample_data_2)
+    _check_test_type(test_type)
+    check_scalar(max_exact_size, name="max_exact_size", target_type=int, min_val=0)
+
+    # Zero differences share the lowest ranks, so that subtracting their number yields the ranks of the non-zero
+    # differences among themselves.
+    abs_diff = np.abs(sample_data_diff)
+    is_zero = abs_diff == 0
+    sample_sizes = sample_data_diff.shape[1] - np.sum(is_zero, axis=1)
+    ranks = stats.rankdata(abs_diff, axis=1) - np.sum(is_zero, axis=1, keepdims=True)
+    w_statistics = np.sum(np.where(sample_data_diff > 0, ranks, 0), axis=1)
+
+    # Approximate the sampling distribution by a normal distribution for large samples.
+    mu = sample_sizes * (sample_sizes + 1) / 4
+    sigma = np.sqrt(sample_sizes * (sample_sizes + 1) * (2 * sample_sizes + 1) / 24)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_statistics = (w_statistics - mu) / sigma
+    p_left = stats.norm.cdf(z_statistics)
+    p_right = 1 - p_left
+
+    # Use the cached exact sampling distributions for small samples.
+    for i in np.flatnonzero(sample_sizes <= max_exact_size):
+        doubled_ranks = tuple(sorted(np.round(2 * ranks[i, ~is_zero[i]]).astype(int).tolist()))
+        p_arr = _signed_rank_distribution(doubled_ranks)
+        w_doubled = int(round(2 * w_statistics[i]))
+        p_left[i] = p_arr[:w_doubled + 1].sum()
+        p_right[i] = p_arr[w_doubled:].sum()
+
+    return w_statistics, _p_values(p_left, p_right, test_type)
+
+
+def multiple_comparison_correction(p, method="holm"):
+    """Adjust p-values for multiple comparisons.
+
+    Parameters
+    ----------
+    p : array-like of any shape
+        p-values of all comparisons, e.g., a matrix of pairwise comparisons. NaN entries, e.g., on the diagonal of
+        such a matrix, are ignored and remain NaN.
+    method : {'holm', 'bh'}, default='holm'
+        If 'holm', the family-wise error rate is controlled by the Holm-Bonferroni step-down method. If 'bh', the
+        false discovery rate is controlled by the Benjamini-Hochberg step-up method.
+
+    Returns
+    -------
+    p_adjusted : numpy.ndarray of the same shape as `p`
+        Adjusted p-values, which are compared to the significance level as usual.
+    """
+    # Check parameters.
+    p = np.asarray(p, dtype=float)
+    if method not in ["holm", "bh"]:
+        raise ValueError("`method` must be in `['holm', 'bh']`")
+
+    p_adjusted = np.full(p.shape, np.nan)
+    is_valid = ~np.isnan(p)
+    p_valid = p[is_valid]
+    if np.any((p_valid < 0) | (p_valid > 1)):
+        raise ValueError("`p` must contain values in `[0, 1]`.")
+
+    order = np.argsort(p_valid, kind="mergesort")
+    n_tests = len(p_valid)
+    if method == "holm":
+        p_sorted = np.maximum.accumulate((n_tests - np.arange(n_tests)) * p_valid[order])
+    else:
+        p_sorted = np.minimum.accumulate((n_tests / np.arange(1, n_tests + 1) * p_valid[order])[::-1])[::-1]
+    p_sorted = np.minimum(p_sorted, 1)
+    p_valid = np.empty(n_tests)
+    p_valid[order] = p_sorted
+    p_adjusted[is_valid] = p_valid
+    return p_adjusted
+
+
+def _check_test_type(test_type):
+    """
+    Checks the type of test.
+    """
+    if test_type not in ["two-sided", "left-tail", "right-tail"]:
+        raise ValueError("`test_type` must be in `['two-sided', 'left-tail', 'right-tail']`")
+
+
+def _check_batch_param(param, name, n_tests):
+    """
+    Broadcasts a scalar or per-test parameter to shape (n_tests,).
+    """
+    param = np.asarray(param, dtype=float)
+    if param.ndim > 1 or (param.ndim == 1 and len(param) != n_tests):
+        raise ValueError(f"`{name}` must be a scalar or an array of shape `(n_tests,)`.")
+    return np.broadcast_to(param, (n_tests,))
+
+
+def _differences(sample_data_1, sample_data_2):
+    """
+    Checks the paired sample data and returns their differences.
+    """
+    sample_data_1 = check_array(sample_data_1)
+    if sample_data_2 is None:
+        return sample_data_1
+    sample_data_2 = check_array(sample_data_2)
+    if sample_data_1.shape != sample_data_2.shape:
+        raise ValueError("`sample_data_1` and `sample_data_2` must have the same shape.")
+    return sample_data_1 - sample_data_2
+
+
+def _p_values(p_left, p_right, test_type):
+    """
+    Computes the p-values for the given type of test from the left- and right-tail probabilities.
+    """
+    if test_type == "two-sided":
+        return 2 * np.minimum(p_left, p_right)
+    elif test_type == "left-tail":
+        return p_left
+    return p_right
@@ -0,0 +1,221 @@
+import numpy as np
+
+from scipy.stats import norm
+from sklearn.utils.validation import check_consistent_length, check_random_state, check_scalar, column_or_1d
+
+from ._model_evaluation import _check_n_jobs, _repetition_seeds, _run_tasks
+from ._performance_measures import confusion_matrix, accuracy, cohen_kappa, macro_f1_measure
+
+
+def bootstrap_confusion_matrices(y_true, y_pred, n_resamples=1000, n_classes=None, resampling='multinomial',
+                                 random_state=None):
+    """Draws confusion matrices of bootstrap resamples of the true and predicted class labels.
+
+    Resampling `n_samples` pairs of labels with replacement only changes how often each cell of the confusion matrix
+    is counted. Hence, the confusion matrices of all resamples are drawn directly from the cell counts, which does not
+    depend on the number of samples.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        Ground truth (correct) target values. Expected to be in the set `{0, ..., n_classes-1}`.
+    y_pred : array-like of shape (n_samples,)
+        Estimated targets as returned by a classifier. Expected to be in the set `{0, ..., n_classes-1}`.
+    n_resamples : int, default=1000
+        Number of bootstrap resamples.
+    n_classes : int, default=None
+        Number of classes. If `n_classes=None`, the number of classes is assumed to be the maximum value of `y_true`
+        and `y_pred`.
+    resampling : {'multinomial', 'poisson'}, default='multinomial'
+        If 'multinomial', each resample consists of exactly `n_samples` pairs of labels. If 'poisson', each pair of
+        labels is weighted by an independent Poisson(1) count, such that the resample size varies.
+    random_state : int, RandomState instance or None, default=None
+        Determines random number generation.
+
+    Returns
+    -------
+    C : np.ndarray of shape (n_resamples, n_classes, n_classes)
+        Confusion matrices of the bootstrap resamples.
+    """
+    # Check parameters.
+    check_scalar(n_resamples, name='n_resamples', target_type=int, min_val=1)
+    _check_resampling(resampling)
+    C = _check_labels(y_true, y_pred, n_classes)
+    return _draw_confusion_matrices(C, n_resamples, resampling, random_state)
+
+
+def bootstrap_confidence_intervals(y_true, y_pred, metrics=None, n_classes=None, n_resamples=10000,
+                                   confidence_level=0.95, method='percentile', resampling='multinomial',
+                                   chunk_size=1000, n_jobs=None, random_state=None, return_distributions=False):
+    """Computes bootstrap confidence intervals of performance measures based on the confusion matrix.
+
+    The resamples and, for `method='bca'`, the jackknife matrices are processed in chunks of `chunk_size` confusion
+    matrices, each of which is evaluated by all performance measures at once, such that the memory is bounded by
+    `chunk_size * n_classes**2` counts.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,)
+        Ground truth (correct) target values. Expected to be in the set `{0, ..., n_classes-1}`.
+    y_pred : array-like of shape (n_samples,)
+        Estimated targets as returned by a classifier. Expected to be in the set `{0, ..., n_classes-1}`.
+    metrics : callable or dict, default=None
+        Performance measure or dictionary of performance measures with names as keys. Each performance measure is
+        called as `metric(C=C)` with a batch of confusion matrices `C` of shape (n, n_classes, n_classes) and returns
+        an array of shape (n,). If None, `accuracy`, `cohen_kappa`, and `macro_f1_measure` are used.
+    n_classes : int, default=None
+        Number of classes. If `n_classes=None`, the number of classes is assumed to be the maximum value of `y_true`
+        and `y_pred`.
+    n_resamples : int, default=10000
+        Number of bootstrap resamples.
+    confidence_level : float in (0, 1), default=0.95
+        Confidence level of the intervals.
+    method : {'percentile', 'bca'}, default='percentile'
+        If 'percentile', the intervals are given by the quantiles of the bootstrap distribution. If 'bca', the
+        quantiles are bias-corrected and accelerated, where the acceleration is estimated via the jackknife.
+    resampling : {'multinomial', 'poisson'}, default='multinomial'
+        Resampling scheme, see `bootstrap_confusion_matrices`.
+    chunk_size : int, default=1000
+        Maximum number of resamples or jackknife matrices evaluated at once. Each chunk holds
+        `chunk_size * n_classes**2` 8-byte counts, so the default is very large for many classes, e.g., about 8 GB per
+        chunk for 1000 classes, and should be reduced accordingly.
+    n_jobs : int, default=None
+        Number of worker processes evaluating the chunks. If None, the chunks are evaluated sequentially.
+    random_state : int, RandomState instance or None, default=None
+        Determines the seeds of the chunks. The results do not depend on `n_jobs`.
+    return_distributions : bool, default=False
+        If True, the bootstrap distributions of the performance measures are returned as well.
+
+    Returns
+    -------
+    intervals : dict
+        Dictionary mapping the name of each performance measure to its interval `(lower, upper)`.
+    distributions : dict
+        Dictionary mapping the name of each performance measure to its values of shape (n_resamples,) on the
+        resamples. Only returned if `return_distributions=True`.
+    """
+    # Check parameters.
+    metrics = _check_metrics(metrics)
+    check_scalar(n_resamples, name='n_resamples', target_type=int, min_val=1)
+    check_scalar(confidence_level, name='confidence_level', target_type=float, min_val=0, max_val=1,
+                 include_boundaries='neither')
+    if method not in ['percentile', 'bca']:
+        raise ValueError("`method` must be in `['percentile', 'bca']`.")
+    _check_resampling(resampling)
+    check_scalar(chunk_size, name='chunk_size', target_type=int, min_val=1)
+    n_jobs = _check_n_jobs(n_jobs)
+    C = _check_labels(y_true, y_pred, n_classes)
+
+    # Evaluate the performance measures on the resamples chunk by chunk.
+    chunk_sizes = np.full(n_resamples // chunk_size, chunk_size)
+    if n_resamples % chunk_size:
+        chunk_sizes = np.append(chunk_sizes, n_resamples % chunk_size)
+    seeds = _repetition_seeds(random_state, len(chunk_sizes))
+    tasks = [(C, int(size), resampling, seed, metrics) for size, seed in zip(chunk_sizes, seeds)]
+    results = _run_tasks(_evaluate_chunk, tasks, n_jobs)
+    distributions = {name: np.concatenate([result[name] for result in results]) for name in metrics}
+
+    alpha = (1 - confidence_level) / 2
+    intervals = {}
+    for name, metric in metrics.items():
+        thetas = distributions[name][~np.isnan(distributions[name])]
+        if len(thetas) == 0:
+            intervals[name] = (np.nan, np.nan)
+            continue
+        quantiles = np.array([alpha, 1 - alpha])
+        if method == 'bca':
+            quantiles = _bca_quantiles(C, metric, thetas, quantiles, chunk_size)
+        lower, upper = np.quantile(thetas, quantiles)
+        intervals[name] = (float(lower), float(upper))
+
+    if return_distributions:
+        return intervals, distributions
+    return intervals
+
+
+def _check_labels(y_true, y_pred, n_classes):
+    """
+    Checks the class labels and returns their confusion matrix.
+    """
+    y_true = column_or_1d(y_true)
+    y_pred = column_or_1d(y_pred)
+    check_consistent_length(y_true, y_pred)
+    if len(y_true) == 0:
+        raise ValueError('`y_true` and `y_pred` must contain at least one sample.')
+    return confusion_matrix(y_true, y_pred, n_classes=n_classes)
+
+
+def _check_resampling(resampling):
+    """
+    Checks the resampling scheme.
+    """
+    if resampling not in ['multinomial', 'poisson']:
+        raise ValueError("`resampling` must be in `['multinomial', 'poisson']`.")
+
+
+def _check_metrics(metrics):
+    """
+    Checks the performance measures and transforms them into a dictionary.
+    """
+    if metrics is None:
+        return {'accuracy': accuracy, 'cohen_kappa': cohen_kappa, 'macro_f1_measure': macro_f1_measure}
+    if callable(metrics):
+        return {getattr(metrics, '__name__', 'metric'): metrics}
+    if not isinstance(metrics, dict) or not all(callable(m) for m in metrics.values()):
+        raise TypeError('`metrics` must be a callable or a dictionary of callables.')
+    return metrics
+
+
+def _draw_confusion_matrices(C, n_resamples, resampling, random_state):
+    """
+    Draws the confusion matrices of `n_resamples` bootstrap resamples from the confusion matrix `C`.
+    """
+    random_state = check_random_state(random_state)
+    counts = C.ravel()
+    if resampling == 'multinomial':
+        draws = random_state.multinomial(counts.sum(), counts / counts.sum(), size=n_resamples)
+    else:
+        draws = random_state.poisson(counts, size=(n_resamples, len(counts)))
+    return draws.reshape(n_resamples, *C.shape)
+
+
+def _evaluate_chunk(C, n_resamples, resampling, seed, metrics):
+    """
+    Evaluates the performance measures on the confusion matrices of one chunk of resamples.
+    """
+    C_batch = _draw_confusion_matrices(C, n_resamples, resampling, seed)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {name: np.asarray(metric(C=C_batch), dtype=float).reshape(n_resamples) for name, metric in
+                metrics.items()}
+
+
+def _bca_quantiles(C, metric, thetas, quantiles, chunk_size):
+    """
+    Computes the bias-corrected and accelerated quantiles. Leaving out one sample only decrements one cell of the
+    confusion matrix, so that the jackknife requires one evaluation per non-empty cell weighted by its count. The
+    cells are evaluated in chunks of `chunk_size` confusion matrices.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        theta_hat = float(metric(C=C))
+
+        # Estimate the bias correction from the fraction of resamples below the estimate.
+        p = (np.sum(thetas < theta_hat) + 0.5 * np.sum(thetas == theta_hat)) / len(thetas)
+        z_0 = norm.ppf(np.clip(p, 1 / (len(thetas) + 1), len(thetas) / (len(thetas) + 1)))
+
+        # Estimate the acceleration via the jackknife.
+        cells = np.flatnonzero(C)
+        weights = C.ravel()[cells]
+        theta_jack = np.empty(len(cells))
+        for start in range(0, len(cells), chunk_size):
+            chunk = cells[start:start + chunk_size]
+            C_jack = np.repeat(C[np.newaxis], len(chunk), axis=0)
+            C_jack.reshape(len(chunk), -1)[np.arange(len(chunk)), chunk] -= 1
+            theta_jack[start:start + len(chunk)] = np.asarray(metric(C=C_jack), dtype=float).reshape(len(chunk))
+        is_valid = ~np.isnan(theta_jack)
+        theta_jack, weights = theta_jack[is_valid], weights[is_valid]
+        u = np.sum(weights * theta_jack) / np.sum(weights) - theta_jack
+        denom = 6 * np.sum(weights * u ** 2) ** 1.5
+        a = np.sum(weights * u ** 3) / denom if denom > 0 else 0.0
+
+    z = norm.ppf(quantiles)
+    return norm.cdf(z_0 + (z_0 + z) / (1 - a * (z_0 + z)))
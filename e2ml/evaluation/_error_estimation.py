@@ -3,7 +3,7 @@ import numpy as np
 from sklearn.utils.validation import check_scalar, column_or_1d, check_random_state, check_consistent_length
 
 
-def cross_validation(sample_indices, n_folds=5, random_state=None, y=None):
+def cross_validation(sample_indices, n_folds=5, random_state=None, y=None, lazy=False):
     """
     Performs a (stratified) k-fold cross-validation.
 
@@ -17,13 +17,16 @@ def cross_validation(sample_indices, n_folds=5, random_state=None, y=None):
         `random_state` affects the ordering of the indices, which controls the randomness of each fold.
     y : array-like of shape (n_samples,), default=None
         The class labels of the samples. Used only if `stratified` is True or if `y` is None.
+    lazy : bool, default=False
+        If True, a generator yielding the pairs `(train[i], test[i])` is returned instead of the lists `train` and
+        `test`, such that only the indices of one iteration are held in memory at once.
 
     Returns
     -------
     train : list
-        Contains the training indices of each iteration, where train[i] represents iteration i.
+        Contains the training indices of each iteration as `numpy.ndarray`, where train[i] represents iteration i.
     test : list
-        Contains the test indices of each iteration, where test[i] represents iteration i.
+        Contains the test indices of each iteration as `numpy.ndarray`, where test[i] represents iteration i.
     """
     # Checks and balances
     sample_indices = column_or_1d(sample_indices, dtype=int).copy()
@@ -33,37 +36,50 @@ def cross_validation(sample_indices, n_folds=5, random_state=None, y=None):
     random_state = check_random_state(random_state)
 
     # Stratification check
-    y = column_or_1d(y, dtype=int) if y is not None else np.zeros(len(sample_indices), dtype=int)
+    y = column_or_1d(y) if y is not None else np.zeros(len(sample_indices), dtype=int)
     check_consistent_length(sample_indices, y)
-    classes, counts = np.unique(y, return_counts=True)
-    classes = classes[np.argsort(-counts)]
 
-    # Data shuffling
-    p = random_state.permutation(len(sample_indices))
-    sample_indices, y = sample_indices[p], y[p]
-
-    # Initialize variables
-    folds = [[] for _ in range(n_folds)]
-    fold_indices = np.arange(n_folds)
-    train, test = [], []
+    # Fold assignment
+    sample_indices, fold_ids = _assign_folds(sample_indices, y, n_folds, random_state)
 
-    # Fold filling
-    for class_y in classes:
-        is_class_y = y == class_y
-        folds_class_y = list(np.array_split(sample_indices[is_class_y], n_folds))
-        fold_lengths = [len(fold) for fold in folds_class_y]
-        sort_idx = np.argsort(fold_lengths)
-        for f_y, f in enumerate(fold_indices[sort_idx]):
-            folds[f].extend(folds_class_y[f_y])
-    
     # Train-test split
-    for f_1 in fold_indices:
-        test.append(folds[f_1])
-        train_f_1 = []
-        for f_2 in fold_indices:
-            if f_2 != f_1:
-                train_f_1.extend(folds[f_2])
-        train.append(train_f_1)
+    splits = (
+        (sample_indices[fold_ids != f], sample_indices[fold_ids == f]) for f in range(n_folds)
+    )
+    if lazy:
+        return splits
+    train, test = [], []
+    for train_f, test_f in splits:
+        train.append(train_f)
+        test.append(test_f)
 
     return train, test
 
+
+def _assign_folds(sample_indices, y, n_folds, random_state):
+    """
+    Assigns a fold id to each sample in a single pass. After shuffling, the samples are sorted (stably) by their
+    classes in the order of decreasing class frequency and distributed over the folds in a round-robin manner,
+    such that each fold contains about the same number of samples of each class.
+
+    Returns
+    -------
+    sample_indices : numpy.ndarray of shape (n_samples,)
+        Shuffled and sorted sample indices.
+    fold_ids : numpy.ndarray of shape (n_samples,)
+        Fold id of each sample in `sample_indices`.
+    """
+    # Data shuffling
+    p = random_state.permutation(len(sample_indices))
+    sample_indices, y = sample_indices[p], y[p]
+
+    # Sorting by class in the order of decreasing class frequency
+    _, y_encoded, counts = np.unique(y, return_inverse=True, return_counts=True)
+    class_ranks = np.empty(len(counts), dtype=np.intp)
+    class_ranks[np.argsort(-counts, kind='stable')] = np.arange(len(counts))
+    order = np.argsort(class_ranks[y_encoded], kind='stable')
+
+    # Round-robin fold filling
+    fold_dtype = np.min_scalar_type(n_folds)
+    fold_ids = (np.arange(len(sample_indices)) % n_folds).astype(fold_dtype)
+    return sample_indices[order], fold_ids
@@ -0,0 +1,387 @@
+import time
+
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from sklearn.base import clone
+from sklearn.model_selection import ParameterGrid
+from sklearn.utils.validation import (
+    check_array, check_consistent_length, check_random_state, check_scalar, column_or_1d
+)
+
+from ._error_estimation import cross_validation
+from ._performance_measures import accuracy
+
+
+def cross_validate(estimator, X, y, scorers=None, n_folds=5, n_jobs=None, random_state=None, stratified=True):
+    """
+    Evaluates an estimator via a (stratified) k-fold cross-validation, where the folds are evaluated in parallel.
+
+    The sample matrix `X` is passed to the worker processes via shared memory, such that each worker reads the
+    samples of its fold without receiving a pickled copy of `X`.
+
+    Parameters
+    ----------
+    estimator : sklearn.base.BaseEstimator
+        Estimator implementing `fit` and `predict`. It is cloned for each fold.
+    X : array-like of shape (n_samples, n_features)
+        Samples.
+    y : array-like of shape (n_samples,)
+        Class labels or target values of the samples.
+    scorers : callable or dict, default=None
+        Performance measures with the signature `scorer(y_true, y_pred)`. A dictionary maps the names of the
+        measures to the measures. If None, `{'accuracy': accuracy}` is used.
+    n_folds : int, default=5
+        Number of folds. Must be at least 2.
+    n_jobs : int, default=None
+        Number of worker processes. If None or 1, the folds are evaluated sequentially.
+    random_state : int, RandomState instance or None, default=None
+        Controls the assignment of the samples to the folds.
+    stratified : bool, default=True
+        If True, the folds are stratified according to `y`.
+
+    Returns
+    -------
+    results : numpy.ndarray of shape (n_folds,)
+        Structured array with one record per fold. Its fields are `fold`, `n_train`, `n_test`, `fit_time`,
+        `score_time`, and one field per performance measure.
+    """
+    # Check parameters.
+    X = check_array(X)
+    y = column_or_1d(y)
+    check_consistent_length(X, y)
+    scorers = _check_scorers(scorers)
+    n_jobs = _check_n_jobs(n_jobs)
+
+    # Create tasks.
+    splits = cross_validation(
+        np.arange(len(X)), n_folds=n_folds, random_state=random_state, y=y if stratified else None, lazy=True
+    )
+    tasks = [(f, train, test) for f, (train, test) in enumerate(splits)]
+
+    # Evaluate folds.
+    with _SharedArray(X, shared=n_jobs > 1) as X_ref:
+        rows = _run_tasks(
+            _evaluate_fold, [(X_ref, y, estimator, train, test, scorers) for _, train, test in tasks], n_jobs
+        )
+
+    # Collect results.
+    dtype = [('fold', int), ('n_train', int), ('n_test', int), ('fit_time', float), ('score_time', float)]
+    dtype += [(name, float) for name in scorers]
+    results = np.zeros(len(tasks), dtype=dtype)
+    for (f, train, test), (fit_time, score_time, scores) in zip(tasks, rows):
+        results[f] = (f, len(train), len(test), fit_time, score_time, *scores)
+    return results
+
+
+def repeated_cross_validate(estimators, X, y, scorer=None, n_repeats=10, n_folds=10, n_jobs=None, random_state=None,
+                            stratified=True, return_fold_scores=False):
+    """
+    Evaluates one or more estimators via a repeated (stratified) k-fold cross-validation, e.g., 5x2cv or 10x10cv.
+
+    All (repetition, fold) pairs are scheduled as one flat list of tasks, which are evaluated in parallel. Within a
+    task, the training and test samples are gathered only once and shared by all estimators, such that the
+    estimators are compared on identical folds.
+
+    Parameters
+    ----------
+    estimators : sklearn.base.BaseEstimator or dict
+        Estimator implementing `fit` and `predict` or a dictionary mapping names to such estimators.
+    X : array-like of shape (n_samples, n_features)
+        Samples.
+    y : array-like of shape (n_samples,)
+        Class labels or target values of the samples.
+    scorer : callable, default=None
+        Performance measure with the signature `scorer(y_true, y_pred)`. If None, `accuracy` is used.
+    n_repeats : int, default=10
+        Number of repetitions of the cross-validation.
+    n_folds : int, default=10
+        Number of folds per repetition. Must be at least 2.
+    n_jobs : int, default=None
+        Number of worker processes. If None or 1, the tasks are evaluated sequentially.
+    random_state : int, RandomState instance or None, default=None
+        Controls the assignment of the samples to the folds of each repetition.
+    stratified : bool, default=True
+        If True, the folds are stratified according to `y`.
+    return_fold_scores : bool, default=False
+        If True, the scores of the individual folds are returned, too.
+
+    Returns
+    -------
+    scores : dict
+        Maps each estimator name to a `numpy.ndarray` of shape (n_repeats,) containing the mean score of each
+        repetition. The arrays of two estimators can be passed directly to `t_test_paired` or
+        `wilcoxon_signed_rank_test`. A single estimator is named 'estimator'.
+    variances : dict
+        Maps each estimator name to a `numpy.ndarray` of shape (n_repeats,) containing the (unbiased) variance of
+        the fold scores within each repetition.
+    fold_scores : dict
+        Maps each estimator name to a `numpy.ndarray` of shape (n_repeats, n_folds) containing the score of each
+        fold. Only returned if `return_fold_scores=True`.
+    """
+    # Check parameters.
+    X = check_array(X)
+    y = column_or_1d(y)
+    check_consistent_length(X, y)
+    estimators = estimators if isinstance(estimators, dict) else {'estimator': estimators}
+    scorer = accuracy if scorer is None else scorer
+    if not callable(scorer):
+        raise TypeError('`scorer` must be a callable.')
+    n_repeats = check_scalar(n_repeats, name='n_repeats', target_type=int, min_val=1)
+    n_jobs = _check_n_jobs(n_jobs)
+
+    # Create one task per repetition and fold.
+    seeds = _repetition_seeds(random_state, n_repeats)
+    tasks = []
+    for r, seed in enumerate(seeds):
+        splits = cross_validation(
+            np.arange(len(X)), n_folds=n_folds, random_state=seed, y=y if stratified else None, lazy=True
+        )
+        tasks.extend((r, f, train, test) for f, (train, test) in enumerate(splits))
+
+    # Evaluate tasks.
+    with _SharedArray(X, shared=n_jobs > 1) as X_ref:
+        rows = _run_tasks(
+            _evaluate_fold_estimators,
+            [(X_ref, y, estimators, train, test, scorer) for _, _, train, test in tasks],
+            n_jobs
+        )
+
+    # Collect results.
+    fold_scores = {name: np.zeros((n_repeats, n_folds)) for name in estimators}
+    for (r, f, _, _), task_scores in zip(tasks, rows):
+        for name, score in zip(estimators, task_scores):
+            fold_scores[name][r, f] = score
+    scores = {name: s.mean(axis=1) for name, s in fold_scores.items()}
+    variances = {name: s.var(axis=1, ddof=1) for name, s in fold_scores.items()}
+    if return_fold_scores:
+        return scores, variances, fold_scores
+    return scores, variances
+
+
+def nested_cross_validate(estimator, param_grid, X, y, scorer=None, n_outer_folds=5, n_inner_folds=3, n_repeats=1,
+                          n_jobs=None, random_state=None, stratified=True, greater_is_better=True):
+    """
+    Evaluates an estimator including its hyperparameter search via a (repeated) nested cross-validation.
+
+    For each outer training set, the hyperparameters are selected via an inner cross-validation over
+    `param_grid`, where the samples of each inner fold are gathered only once and shared by all candidate
+    hyperparameters. The estimator with the selected hyperparameters is refitted on the outer training set and
+    evaluated on the outer test set. All (repetition, outer fold) pairs are evaluated in parallel as one flat list
+    of tasks.
+
+    Parameters
+    ----------
+    estimator : sklearn.base.BaseEstimator
+        Estimator implementing `fit` and `predict`.
+    param_grid : dict or list of dicts
+        Candidate hyperparameters in the format of `sklearn.model_selection.ParameterGrid`.
+    X : array-like of shape (n_samples, n_features)
+        Samples.
+    y : array-like of shape (n_samples,)
+        Class labels or target values of the samples.
+    scorer : callable, default=None
+        Performance measure with the signature `scorer(y_true, y_pred)`. If None, `accuracy` is used.
+    n_outer_folds : int, default=5
+        Number of outer folds. Must be at least 2.
+    n_inner_folds : int, default=3
+        Number of inner folds. Must be at least 2.
+    n_repeats : int, default=1
+        Number of repetitions of the nested cross-validation.
+    n_jobs : int, default=None
+        Number of worker processes. If None or 1, the tasks are evaluated sequentially.
+    random_state : int, RandomState instance or None, default=None
+        Controls the assignment of the samples to the outer and inner folds.
+    stratified : bool, default=True
+        If True, the outer and inner folds are stratified according to `y`.
+    greater_is_better : bool, default=True
+        If True, the hyperparameters with the highest mean inner score are selected. Otherwise, the ones with the
+        lowest mean inner score are selected.
+
+    Returns
+    -------
+    scores : numpy.ndarray of shape (n_repeats,)
+        Mean outer score of each repetition.
+    fold_scores : numpy.ndarray of shape (n_repeats, n_outer_folds)
+        Outer score of each fold.
+    best_params : list
+        Selected hyperparameters, where `best_params[r][f]` belongs to repetition `r` and outer fold `f`.
+    """
+    # Check parameters.
+    X = check_array(X)
+    y = column_or_1d(y)
+    check_consistent_length(X, y)
+    candidates = list(ParameterGrid(param_grid))
+    scorer = accuracy if scorer is None else scorer
+    if not callable(scorer):
+        raise TypeError('`scorer` must be a callable.')
+    n_repeats = check_scalar(n_repeats, name='n_repeats', target_type=int, min_val=1)
+    check_scalar(n_inner_folds, name='n_inner_folds', target_type=int, min_val=2)
+    n_jobs = _check_n_jobs(n_jobs)
+
+    # Create one task per repetition and outer fold.
+    seeds = _repetition_seeds(random_state, n_repeats)
+    tasks = []
+    for r, seed in enumerate(seeds):
+        splits = cross_validation(
+            np.arange(len(X)), n_folds=n_outer_folds, random_state=seed, y=y if stratified else None, lazy=True
+        )
+        tasks.extend((r, f, train, test) for f, (train, test) in enumerate(splits))
+
+    # Evaluate tasks.
+    with _SharedArray(X, shared=n_jobs > 1) as X_ref:
+        rows = _run_tasks(
+            _evaluate_nested_fold,
+            [
+                (X_ref, y, estimator, candidates, train, test, scorer, n_inner_folds, seeds[r], stratified,
+                 greater_is_better)
+                for r, _, train, test in tasks
+            ],
+            n_jobs
+        )
+
+    # Collect results.
+    fold_scores = np.zeros((n_repeats, n_outer_folds))
+    best_params = [[None] * n_outer_folds for _ in range(n_repeats)]
+    for (r, f, _, _), (score, params) in zip(tasks, rows):
+        fold_scores[r, f] = score
+        best_params[r][f] = params
+    return fold_scores.mean(axis=1), fold_scores, best_params
+
+
+def _evaluate_fold(X_ref, y, estimator, train, test, scorers):
+    """
+    Fits a clone of `estimator` on the training samples and evaluates it on the test samples of a single fold.
+    """
+    X_train, X_test = _take_rows(X_ref, train, test)
+    start = time.perf_counter()
+    est = clone(estimator).fit(X_train, y[train])
+    fit_time = time.perf_counter() - start
+    start = time.perf_counter()
+    y_pred = est.predict(X_test)
+    scores = [scorer(y[test], y_pred) for scorer in scorers.values()]
+    score_time = time.perf_counter() - start
+    return fit_time, score_time, scores
+
+
+def _evaluate_fold_estimators(X_ref, y, estimators, train, test, scorer):
+    """
+    Fits clones of all estimators on the training samples of a single fold and evaluates them on its test samples.
+    """
+    X_train, X_test = _take_rows(X_ref, train, test)
+    y_train, y_test = y[train], y[test]
+    return [scorer(y_test, clone(est).fit(X_train, y_train).predict(X_test)) for est in estimators.values()]
+
+
+def _evaluate_nested_fold(X_ref, y, estimator, candidates, train, test, scorer, n_inner_folds, seed, stratified,
+                          greater_is_better):
+    """
+    Selects the hyperparameters via an inner cross-validation on the training samples of a single outer fold and
+    evaluates the refitted estimator on its test samples.
+    """
+    X_train, X_test = _take_rows(X_ref, train, test)
+    y_train, y_test = y[train], y[test]
+
+    # Inner cross-validation, where each inner fold is shared by all candidates.
+    inner_scores = np.zeros((len(candidates), n_inner_folds))
+    splits = cross_validation(
+        np.arange(len(X_train)), n_folds=n_inner_folds, random_state=seed, y=y_train if stratified else None,
+        lazy=True
+    )
+    for f, (inner_train, inner_test) in enumerate(splits):
+        X_inner_train, X_inner_test = X_train[inner_train], X_train[inner_test]
+        for c, params in enumerate(candidates):
+            est = clone(estimator).set_params(**params).fit(X_inner_train, y_train[inner_train])
+            inner_scores[c, f] = scorer(y_train[inner_test], est.predict(X_inner_test))
+    mean_scores = inner_scores.mean(axis=1)
+    best = int(np.argmax(mean_scores) if greater_is_better else np.argmin(mean_scores))
+
+    # Refit on the outer training samples.
+    est = clone(estimator).set_params(**candidates[best]).fit(X_train, y_train)
+    return scorer(y_test, est.predict(X_test)), candidates[best]
+
+
+def _repetition_seeds(random_state, n_repeats):
+    """
+    Draws one seed per repetition.
+    """
+    return check_random_state(random_state).randint(np.iinfo(np.int32).max, size=n_repeats)
+
+
+def _check_scorers(scorers):
+    """
+    Checks the performance measures and transforms them into a dictionary.
+    """
+    if scorers is None:
+        return {'accuracy': accuracy}
+    if callable(scorers):
+        return {getattr(scorers, '__name__', 'score'): scorers}
+    if not isinstance(scorers, dict) or not all(callable(s) for s in scorers.values()):
+        raise TypeError('`scorers` must be a callable or a dictionary of callables.')
+    return scorers
+
+
+def _check_n_jobs(n_jobs):
+    """
+    Checks the number of worker processes.
+    """
+    if n_jobs is None:
+        return 1
+    return check_scalar(n_jobs, name='n_jobs', target_type=int, min_val=1)
+
+
+def _run_tasks(func, tasks, n_jobs):
+    """
+    Evaluates `func` for each tuple of arguments in `tasks` using `n_jobs` worker processes and returns the results
+    in the order of `tasks`.
+    """
+    if n_jobs == 1 or len(tasks) <= 1:
+        return [func(*args) for args in tasks]
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as workers:
+        futures = [workers.submit(func, *args) for args in tasks]
+        return [future.result() for future in futures]
+
+
+class _SharedArray:
+    """
+    Context manager placing an array in shared memory. It yields a picklable reference, whose rows are read via
+    `_take_rows`. If `shared=False`, the array itself serves as reference.
+    """
+
+    def __init__(self, X, shared=True):
+        self.X = X
+        self.shared = shared
+        self._shm = None
+
+    def __enter__(self):
+        if not self.shared:
+            return self.X
+        self._shm = shared_memory.SharedMemory(create=True, size=max(self.X.nbytes, 1))
+        X_shared = np.ndarray(self.X.shape, dtype=self.X.dtype, buffer=self._shm.buf)
+        X_shared[...] = self.X
+        del X_shared
+        return self._shm.name, self.X.shape, self.X.dtype.str
+
+    def __exit__(self, *exc_info):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+def _take_rows(X_ref, *indices):
+    """
+    Resolves a reference created by `_SharedArray` and returns copies of the rows selected by each index array.
+    """
+    if isinstance(X_ref, np.ndarray):
+        return [X_ref[idx] for idx in indices]
+    name, shape, dtype = X_ref
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        X = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        rows = [X[idx] for idx in indices]
+        del X
+    finally:
+        shm.close()
+    return rows
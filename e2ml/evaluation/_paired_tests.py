@@ -1,7 +1,7 @@
 import numpy as np
-import itertools
 
-from sklearn.utils.validation import check_array
+from functools import lru_cache
+from sklearn.utils.validation import check_array, check_scalar
 from scipy import stats
 
 from ._one_sample_tests import t_test_one_sample
@@ -51,7 +51,7 @@ def t_test_paired(sample_data_1, sample_data_2=None, mu_0=0, test_type="two-side
     return t_test_one_sample(sample_data_diff, mu_0=mu_0, test_type=test_type)
 
 
-def wilcoxon_signed_rank_test(sample_data_1, sample_data_2=None, test_type="two-sided"):
+def wilcoxon_signed_rank_test(sample_data_1, sample_data_2=None, test_type="two-sided", max_exact_size=30):
     """Perform a Wilcoxon signed-rank test.
 
     Parameters
@@ -63,6 +63,10 @@ def wilcoxon_signed_rank_test(sample_data_1, sample_data_2=None, test_type="two-
         Sample data drawn from a population 2.
     test_type : {'right-tail', 'left-tail', 'two-sided'}
         Specifies the type of test for computing the p-value.
+    max_exact_size : int, default=30
+        Maximum number of non-zero differences for which the p-value is computed from the exact sampling distribution
+        of the test statistic. For more differences, the sampling distribution is approximated by a normal
+        distribution.
 
     Returns
     -------
@@ -77,6 +81,7 @@ def wilcoxon_signed_rank_test(sample_data_1, sample_data_2=None, test_type="two-
         sample_data_2 = check_array(sample_data_2, ensure_2d=False)
     if test_type not in ["two-sided", "left-tail", "right-tail"]:
         raise ValueError("`test_type` must be in `['two-sided', 'left-tail', 'right-tail']`")
+    check_scalar(max_exact_size, name="max_exact_size", target_type=int, min_val=0)
 
     sample_data_diff = sample_data_1 if sample_data_2 is None else sample_data_1 - sample_data_2
 
@@ -103,7 +108,7 @@ def wilcoxon_signed_rank_test(sample_data_1, sample_data_2=None, test_type="two-
     p_left = 0
     p_right = 0
 
-    if sample_size > 30: # assume normal distribution
+    if sample_size > max_exact_size: # assume normal distribution
         # compute mu and sigma
         mu = sample_size * (sample_size + 1) / 4
         sigma = sample_size * (sample_size + 1) * (2 * sample_size + 1) / 24
@@ -114,18 +119,15 @@ def wilcoxon_signed_rank_test(sample_data_1, sample_data_2=None, test_type="two-
         # determine p_left and p_right
         p_left = stats.norm.cdf(z_statistic)
         p_right = 1 - p_left
-    elif sample_size <= 30: # use sampling distribution
-        # compute all possible combinations
-        w_dict = {}
-        for comb in itertools.product([0, 1], repeat=sample_size):
-            w_statistic_ = np.sum(np.array(comb) * ranks[None, :])
-            w_dict[w_statistic_] = w_dict.get(w_statistic_, 0) + 1
-        w_stat_arr = np.array(list(w_dict.keys()))
-        p_arr = np.array(list(w_dict.values())) / 2 ** sample_size
+    else: # use sampling distribution
+        # doubled ranks are integers even for ties, whose average ranks may be half-integers
+        doubled_ranks = tuple(sorted(np.round(2 * ranks).astype(int).tolist()))
+        p_arr = _signed_rank_distribution(doubled_ranks)
 
         # determine p_left and p_right using the above distribution
-        p_left = p_arr[w_stat_arr <= w_statistic].sum()
-        p_right = p_arr[w_stat_arr >= w_statistic].sum()
+        w_doubled = int(round(2 * w_statistic))
+        p_left = p_arr[:w_doubled + 1].sum()
+        p_right = p_arr[w_doubled:].sum()
 
     # determine p-value based on test_type
     if test_type == "two-sided":
@@ -137,3 +139,21 @@ def wilcoxon_signed_rank_test(sample_data_1, sample_data_2=None, test_type="two-
 
     return w_statistic, p
 
+
+@lru_cache(maxsize=128)
+def _signed_rank_distribution(doubled_ranks):
+    """
+    Computes the exact sampling distribution of twice the positive rank sum, where each rank in `doubled_ranks` is
+    positive or negative with probability 0.5. The subset-sum dynamic program adds one rank after the other in
+    O(n_samples * sum(doubled_ranks)) instead of enumerating all 2^n_samples sign combinations. The result is cached
+    per tie pattern, i.e., per sorted tuple of doubled ranks.
+    """
+    p_arr = np.zeros(sum(doubled_ranks) + 1)
+    p_arr[0] = 1
+    max_sum = 0
+    for rank in doubled_ranks:
+        max_sum += rank
+        p_arr[rank:max_sum + 1] = 0.5 * (p_arr[rank:max_sum + 1] + p_arr[:max_sum + 1 - rank])
+        p_arr[:rank] *= 0.5
+    p_arr.setflags(write=False)
+    return p_arr
@@ -1,11 +1,12 @@
 import numpy as np
 
+from scipy import sparse as sp
 from sklearn.utils.validation import check_consistent_length, check_scalar, column_or_1d
 
 from . import zero_one_loss
 
 
-def confusion_matrix(y_true, y_pred, *, n_classes=None, normalize=None):
+def confusion_matrix(y_true, y_pred, *, n_classes=None, normalize=None, sparse=False):
     """Compute confusion matrix to evaluate the accuracy of a classifier.
 
     By definition a confusion matrix `C` is such that `C_ij` is equal to the number of observations known to be class
@@ -23,10 +24,12 @@ def confusion_matrix(y_true, y_pred, *, n_classes=None, normalize=None):
     normalize : {'true', 'pred', 'all'}, default=None
         Normalizes confusion matrix over the true (rows), predicted (columns) conditions or all the population. If None,
         confusion matrix will not be normalized.
+    sparse : bool, default=False
+        If True, the confusion matrix is returned as `scipy.sparse.csr_matrix`, which is recommended for many classes.
 
     Returns
     -------
-    C : np.ndarray of shape (n_classes, n_classes)
+    C : np.ndarray or scipy.sparse.csr_matrix of shape (n_classes, n_classes)
         Confusion matrix whose i-th row and j-th column entry indicates the number of amples with true label being
         i-th class and predicted label being j-th class.
     """
@@ -55,12 +58,15 @@ def confusion_matrix(y_true, y_pred, *, n_classes=None, normalize=None):
             raise e
         raise ValueError(f'Invalid input: {e}')
 
-    # Compute confusion matrix.
-    C = np.zeros((n_classes, n_classes), dtype=int)
-
-    for i in range(n_classes):
-        for j in range(n_classes):
-            C[i, j] = np.sum((y_true == i) & (y_pred == j))
+    # Compute confusion matrix in a single pass by counting the joint indices `y_true * n_classes + y_pred`.
+    y_true = y_true.astype(np.intp)
+    y_pred = y_pred.astype(np.intp)
+    if sparse:
+        C = sp.coo_matrix(
+            (np.ones(len(y_true), dtype=int), (y_true, y_pred)), shape=(n_classes, n_classes)
+        ).tocsr()
+        return _normalize_sparse(C, normalize)
+    C = np.bincount(y_true * n_classes + y_pred, minlength=n_classes * n_classes).reshape(n_classes, n_classes)
 
     if normalize == 'true':
         C = C / C.sum(axis=1, keepdims=True)
@@ -73,7 +79,49 @@ def confusion_matrix(y_true, y_pred, *, n_classes=None, normalize=None):
     return C
 
 
-def accuracy(y_true, y_pred):
+def _normalize_sparse(C, normalize):
+    """
+    Normalizes a sparse confusion matrix, where rows or columns without samples remain zero.
+    """
+    if normalize is None:
+        return C
+    C = C.astype(float)
+    if normalize == 'all':
+        return C / max(C.sum(), 1)
+    axis = 1 if normalize == 'true' else 0
+    sums = np.asarray(C.sum(axis=axis)).ravel()
+    scale = sp.diags(np.divide(1.0, sums, out=np.zeros(len(sums)), where=sums > 0))
+    return (scale @ C if normalize == 'true' else C @ scale).tocsr()
+
+
+def _confusion_matrix_sums(C):
+    """
+    Computes the diagonal, row sums, column sums, and total sum of a dense or sparse confusion matrix. Dense
+    matrices may be batches of shape (..., n_classes, n_classes), whose sums are computed per matrix.
+    """
+    if sp.issparse(C):
+        return (
+            C.diagonal(), np.asarray(C.sum(axis=1)).ravel(), np.asarray(C.sum(axis=0)).ravel(), C.sum()
+        )
+    C = np.asarray(C)
+    return np.diagonal(C, axis1=-2, axis2=-1), C.sum(axis=-1), C.sum(axis=-2), C.sum(axis=(-2, -1))
+
+
+def _check_confusion_matrix(y_true, y_pred, n_classes, C):
+    """
+    Returns the precomputed confusion matrix `C` or computes it from `y_true` and `y_pred`.
+    """
+    if C is not None:
+        C = C if sp.issparse(C) else np.asarray(C)
+        if C.ndim < 2 or C.shape[-2] != C.shape[-1]:
+            raise ValueError(f'`C` must be a square matrix or a batch of square matrices, got shape {C.shape}.')
+        return C
+    if y_true is None or y_pred is None:
+        raise ValueError('Either `y_true` and `y_pred` or `C` must be given.')
+    return confusion_matrix(y_true=y_true, y_pred=y_pred, n_classes=n_classes)
+
+
+def accuracy(y_true=None, y_pred=None, *, C=None):
     """Computes the accuracy of the predicted class label `y_pred` regarding the true class labels `y_true`.
 
     Parameters
@@ -82,6 +130,9 @@ def accuracy(y_true, y_pred):
         True class labels as array-like object.
     y_pred : array-like of shape (n_labels,)
         Predicted class labels as array-like object.
+    C : np.ndarray of shape (..., n_classes, n_classes) or scipy.sparse matrix, default=None
+        Precomputed confusion matrix or batch of confusion matrices, e.g., of bootstrap resamples. If given, `y_true`
+        and `y_pred` are ignored.
 
     Returns
     -------
@@ -89,11 +140,12 @@ def accuracy(y_true, y_pred):
         Accuracy.
     """
     # return 1 - zero_one_loss(y_true=y_true, y_pred=y_pred)
-    conf_mat = confusion_matrix(y_true=y_true, y_pred=y_pred)
-    return np.sum(np.diag(conf_mat)) / np.sum(conf_mat)
+    conf_mat = _check_confusion_matrix(y_true, y_pred, None, C)
+    diag, _, _, total = _confusion_matrix_sums(conf_mat)
+    return np.sum(diag, axis=-1) / total
 
 
-def cohen_kappa(y_true, y_pred, n_classes=None):
+def cohen_kappa(y_true=None, y_pred=None, n_classes=None, *, C=None):
     """Compute Cohen's kappa: a statistic that measures agreement between true and predicted class labeles.
 
     This function computes Cohen's kappa, a score that expresses the level of agreement between true and predicted class
@@ -113,24 +165,25 @@ def cohen_kappa(y_true, y_pred, n_classes=None):
     n_classes : int
         Number of classes. If `n_classes=None`, the number of classes is assumed to be the maximum value of `y_ture`
         and `y_pred`.
+    C : np.ndarray of shape (..., n_classes, n_classes) or scipy.sparse matrix, default=None
+        Precomputed confusion matrix or batch of confusion matrices, e.g., of bootstrap resamples. If given, `y_true`,
+        `y_pred`, and `n_classes` are ignored.
 
     Returns
     -------
     kappa : float in [-1, 1]
         The kappa statistic between -1 and 1.
     """
-    C = confusion_matrix(y_true=y_true, y_pred=y_pred, n_classes=n_classes)
-    n_classes = len(C)
-    c0 = np.sum(C, axis=0)
-    c1 = np.sum(C, axis=1)
-    expected = np.outer(c0, c1) / np.sum(c0)
-    w_mat = np.ones((n_classes, n_classes), dtype=int)
-    w_mat.flat[:: n_classes + 1] = 0
-    kappa = 1 - np.sum(w_mat * C) / np.sum(w_mat * expected)
+    C = _check_confusion_matrix(y_true, y_pred, n_classes, C)
+    diag, c1, c0, total = _confusion_matrix_sums(C)
+    # The weighted sums of the observed and expected agreement only require the off-diagonal sums.
+    observed_disagreement = total - np.sum(diag, axis=-1)
+    expected_disagreement = total - np.sum(c0 * c1, axis=-1) / total
+    kappa = 1 - observed_disagreement / expected_disagreement
     return kappa
 
 
-def macro_f1_measure(y_true, y_pred, n_classes=None):
+def macro_f1_measure(y_true=None, y_pred=None, n_classes=None, *, C=None):
     """Computes the marco F1 measure.
 
     The F1 measure is compute for each class individually and then averaged. If there is a class label with no true nor
@@ -145,18 +198,17 @@ def macro_f1_measure(y_true, y_pred, n_classes=None):
     n_classes : int
         Number of classes. If `n_classes=None`, the number of classes is assumed to be the maximum value of `y_ture`
         and `y_pred`.
+    C : np.ndarray of shape (..., n_classes, n_classes) or scipy.sparse matrix, default=None
+        Precomputed confusion matrix or batch of confusion matrices, e.g., of bootstrap resamples. If given, `y_true`,
+        `y_pred`, and `n_classes` are ignored.
 
     Returns
     -------
     macro_f1 : float in [0, 1]
         The marco f1 measure between 0 and 1.
     """
-    C = confusion_matrix(y_true=y_true, y_pred=y_pred, n_classes=n_classes)
-    n_classes = len(C)
-    f1 = np.zeros(n_classes)
-    for i in range(n_classes):
-        if C[i, :].sum() == 0 and C[:, i].sum() == 0:
-            f1[i] = 0.0
-        else:
-            f1[i] = 2 * C[i, i] / (C[i, :].sum() + C[:, i].sum())
-    return np.mean(f1)
+    C = _check_confusion_matrix(y_true, y_pred, n_classes, C)
+    diag, row_sums, col_sums, _ = _confusion_matrix_sums(C)
+    denom = row_sums + col_sums
+    f1 = np.divide(2 * diag, denom, out=np.zeros(np.shape(diag)), where=denom > 0)
+    return np.mean(f1, axis=-1)
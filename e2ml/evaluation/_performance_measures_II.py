@@ -1,10 +1,18 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def roc_curve(labels, x, scores):
+from scipy.special import rel_entr
+from scipy.stats import rankdata
+from sklearn.utils.validation import check_consistent_length, check_scalar, column_or_1d
+
+
+def roc_curve(labels, x, scores, max_points=None):
     """
     Generate the Receiver Operating Characteristic (ROC) curve for a binary classification problem.
 
+    The scores are sorted only once and the true and false positives at all distinct thresholds are obtained via
+    cumulative sums, i.e., the curve is computed in O(n_samples * log(n_samples)).
+
     Parameters
     ----------
     labels : array-like of shape (n_samples,)
@@ -13,15 +21,43 @@ def roc_curve(labels, x, scores):
         Positive class or class of interest.
     scores : array-like of shape (n_samples,)
         Scores or probabilities assigned to each sample.
+    max_points : int, default=None
+        Maximum number of returned points. If the curve has more points, evenly spaced points including the first
+        and the last one are kept, e.g., to plot curves of millions of scores. If None, all points are returned.
 
     Returns
     -------
     roc_curve : ndarray of shape (n_thresholds, 2)
-        Array containing the true positive rate (TPR) and false positive rate (FPR) pairs
-        at different classification thresholds.
+        Array containing the false positive rate (FPR) and true positive rate (TPR) pairs
+        at different classification thresholds, starting with (0, 0) and ending with (1, 1).
 
     """
-# TODO 
+    # Check parameters.
+    labels = column_or_1d(labels)
+    scores = column_or_1d(scores).astype(float)
+    check_consistent_length(labels, scores)
+    if max_points is not None:
+        check_scalar(max_points, name='max_points', target_type=int, min_val=2)
+    is_pos = labels == x
+    n_pos = np.sum(is_pos)
+    n_neg = len(is_pos) - n_pos
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError('`labels` must contain samples of the positive class `x` and of other classes.')
+
+    # Sort scores in decreasing order and determine the last position of each distinct threshold.
+    order = np.argsort(-scores, kind='mergesort')
+    scores, is_pos = scores[order], is_pos[order]
+    threshold_ends = np.r_[np.flatnonzero(np.diff(scores)), len(scores) - 1]
+
+    # Count true and false positives for all thresholds at once.
+    tps = np.cumsum(is_pos)[threshold_ends]
+    fps = threshold_ends + 1 - tps
+    points = np.column_stack((np.r_[0, fps] / n_neg, np.r_[0, tps] / n_pos))
+
+    if max_points is not None and len(points) > max_points:
+        points = points[np.unique(np.round(np.linspace(0, len(points) - 1, max_points)).astype(int))]
+    return points
+
 
 def roc_auc(points):
     """
@@ -38,14 +74,56 @@ def roc_auc(points):
         Area Under the ROC curve.
 
     """
-# TODO 
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError('`points` must have shape `(n_points, 2)`.')
 
+    # Apply the trapezoidal rule to the points sorted by FPR and TPR.
+    points = points[np.lexsort((points[:, 1], points[:, 0]))]
+    fpr, tpr = points[:, 0], points[:, 1]
+    return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
 
 
-def draw_lift_chart(true_labels, pos, predicted):
+def roc_auc_rank(labels, x, scores):
+    """
+    Compute the Area Under the Receiver Operating Characteristic (ROC) curve directly from the scores via the
+    rank-sum (Mann-Whitney U) statistic, where tied scores receive their average rank.
+
+    Parameters
+    ----------
+    labels : array-like of shape (n_samples,)
+        True class labels for each sample.
+    x : int or str
+        Positive class or class of interest.
+    scores : array-like of shape (n_samples,)
+        Scores or probabilities assigned to each sample.
+
+    Returns
+    -------
+    auc : float
+        Area Under the ROC curve.
+
+    """
+    labels = column_or_1d(labels)
+    scores = column_or_1d(scores)
+    check_consistent_length(labels, scores)
+    is_pos = labels == x
+    n_pos = np.sum(is_pos)
+    n_neg = len(is_pos) - n_pos
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError('`labels` must contain samples of the positive class `x` and of other classes.')
+
+    ranks = rankdata(scores)
+    return float((np.sum(ranks[is_pos]) - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg))
+
+
+def draw_lift_chart(true_labels, pos, predicted, ax=None):
     """
     Draw a Lift Chart based on the true labels, positive class, and predicted class labels.
 
+    The samples predicted as positive class are targeted first. The chart shows the cumulative number of true
+    positives over the number of targeted samples together with the baseline of targeting samples at random.
+
     Parameters
     ----------
     true_labels : array-like
@@ -54,18 +132,38 @@ def draw_lift_chart(true_labels, pos, predicted):
         Positive class or class of interest.
     predicted : array-like
         Predicted class labels for each sample.
+    ax : matplotlib.axes.Axes, default=None
+        The axis on which the chart is drawn. If None, the current axis is used.
 
     Returns
     -------
     None
 
     """
-# TODO 
+    true_labels = column_or_1d(true_labels)
+    predicted = column_or_1d(predicted)
+    check_consistent_length(true_labels, predicted)
+    if ax is None:
+        ax = plt.gca()
+
+    # Sort once so that the samples predicted as positive class come first.
+    order = np.argsort(-(predicted == pos).astype(int), kind='mergesort')
+    true_positives = np.r_[0, np.cumsum(true_labels[order] == pos)]
+    n_targeted = np.arange(len(true_labels) + 1)
+
+    ax.plot(n_targeted, true_positives, label='Model')
+    ax.plot([0, len(true_labels)], [0, true_positives[-1]], linestyle='--', label='Random')
+    ax.set_xlabel('Number of targeted samples')
+    ax.set_ylabel('Number of true positives')
+    ax.legend()
+
 
 def kl_divergence(p, q):
     """
     Compute the Kullback-Leibler (KL) divergence between two probability distributions `p` and `q`.
 
+    Batches of distributions are supported, where the last axis indexes the events of each distribution.
+
     Parameters
     ----------
     p : array-like
@@ -76,7 +174,16 @@ def kl_divergence(p, q):
     Returns
     -------
     kl_div : float
-        KL divergence between P and Q.
+        KL divergence between P and Q. For batches of distributions, a `numpy.ndarray` with one divergence per pair
+        of distributions is returned.
 
     """
-# TODO 
+    p = np.asarray(p, dtype=float)
+    q = np.asarray(q, dtype=float)
+    if p.shape[-1] != q.shape[-1]:
+        raise ValueError('`p` and `q` must have the same number of events.')
+    if np.any(p < 0) or np.any(q < 0):
+        raise ValueError('`p` and `q` must not contain negative probabilities.')
+
+    kl_div = np.sum(rel_entr(p, q), axis=-1)
+    return float(kl_div) if np.ndim(kl_div) == 0 else kl_div
@@ -0,0 +1,235 @@
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, islice
+from math import comb
+
+from sklearn.utils.validation import check_array, check_random_state, check_scalar
+from scipy import stats
+
+from ._batched_tests import _check_test_type, _p_values
+from ._model_evaluation import _check_n_jobs, _repetition_seeds
+
+
+def permutation_test_paired(sample_data_1, sample_data_2=None, test_type="two-sided", n_resamples=10000,
+                            block_size=1000, alpha=0.05, early_stopping=True, confidence_level=0.99, n_jobs=None,
+                            random_state=None):
+    """Perform a paired permutation test on the mean difference.
+
+    Under the null hypothesis, the differences are symmetric around zero, so that their signs are exchangeable. The
+    sign flips are generated in blocks of `block_size` rows, whose mean differences are computed by a single
+    matrix-vector product. If `2**n_samples <= n_resamples`, all sign flips are enumerated and the p-value is exact.
+
+    Parameters
+    ----------
+    sample_data_1 : array-like of shape (n_samples,)
+        Sample data drawn from a population 1. If no sample data is given, `sample_data_1` is assumed to consist of
+        differences.
+    sample_data_2 : array-like of shape (n_samples,), optional (default=None)
+        Sample data drawn from a population 2.
+    test_type : {'right-tail', 'left-tail', 'two-sided'}
+        Specifies the type of test for computing the p-value.
+    n_resamples : int, default=10000
+        Maximum number of random sign flips.
+    block_size : int, default=1000
+        Number of sign flips evaluated at once.
+    alpha : float in (0, 1), default=0.05
+        Significance level used for early stopping.
+    early_stopping : bool, default=True
+        If True, the resampling stops as soon as the Clopper-Pearson interval of the p-value with confidence level
+        `confidence_level` lies completely below or above `alpha`.
+    confidence_level : float in (0, 1), default=0.99
+        Confidence level of the interval of the p-value used for early stopping.
+    n_jobs : int, default=None
+        Number of worker processes evaluating one block each per round. If None, the blocks are evaluated
+        sequentially.
+    random_state : int, RandomState instance or None, default=None
+        Determines the seeds of the blocks.
+
+    Returns
+    -------
+    statistic : float
+        Observed mean difference as test statistic.
+    p : float
+        p-value for the observed sample data.
+    """
+    # Check parameters.
+    sample_data_1 = check_array(sample_data_1, ensure_2d=False)
+    if sample_data_2 is not None:
+        sample_data_2 = check_array(sample_data_2, ensure_2d=False)
+    sample_data_diff = sample_data_1 if sample_data_2 is None else sample_data_1 - sample_data_2
+    sample_data_diff = sample_data_diff.ravel()
+
+    statistic = float(np.mean(sample_data_diff))
+    p = _permutation_p_value(
+        "paired", sample_data_diff, len(sample_data_diff), statistic, 2 ** len(sample_data_diff), test_type,
+        n_resamples, block_size, alpha, early_stopping, confidence_level, n_jobs, random_state
+    )
+    return statistic, p
+
+
+def permutation_test_two_sample(sample_data_1, sample_data_2, test_type="two-sided", n_resamples=10000,
+                                block_size=1000, alpha=0.05, early_stopping=True, confidence_level=0.99, n_jobs=None,
+                                random_state=None):
+    """Perform a two-sample permutation test on the difference of means.
+
+    Under the null hypothesis, both samples are drawn from the same population, so that the assignment of the pooled
+    samples to the two groups is exchangeable. The assignments are generated in blocks of `block_size` rows, whose
+    differences of means are computed by a single matrix-vector product. If the number of distinct assignments does
+    not exceed `n_resamples`, all of them are enumerated and the p-value is exact.
+
+    Parameters
+    ----------
+    sample_data_1 : array-like of shape (n_samples_1,)
+        Sample data drawn from a population 1.
+    sample_data_2 : array-like of shape (n_samples_2,)
+        Sample data drawn from a population 2.
+    test_type : {'right-tail', 'left-tail', 'two-sided'}
+        Specifies the type of test for computing the p-value.
+    n_resamples : int, default=10000
+        Maximum number of random permutations.
+    block_size : int, default=1000
+        Number of permutations evaluated at once.
+    alpha : float in (0, 1), default=0.05
+        Significance level used for early stopping.
+    early_stopping : bool, default=True
+        If True, the resampling stops as soon as the Clopper-Pearson interval of the p-value with confidence level
+        `confidence_level` lies completely below or above `alpha`.
+    confidence_level : float in (0, 1), default=0.99
+        Confidence level of the interval of the p-value used for early stopping.
+    n_jobs : int, default=None
+        Number of worker processes evaluating one block each per round. If None, the blocks are evaluated
+        sequentially.
+    random_state : int, RandomState instance or None, default=None
+        Determines the seeds of the blocks.
+
+    Returns
+    -------
+    statistic : float
+        Observed difference of the means of population 1 and population 2 as test statistic.
+    p : float
+        p-value for the observed sample data.
+    """
+    # Check parameters.
+    sample_data_1 = check_array(sample_data_1, ensure_2d=False).ravel()
+    sample_data_2 = check_array(sample_data_2, ensure_2d=False).ravel()
+
+    statistic = float(np.mean(sample_data_1) - np.mean(sample_data_2))
+    pooled_data = np.concatenate((sample_data_1, sample_data_2))
+    p = _permutation_p_value(
+        "two-sample", pooled_data, len(sample_data_1), statistic, comb(len(pooled_data), len(sample_data_1)),
+        test_type, n_resamples, block_size, alpha, early_stopping, confidence_level, n_jobs, random_state
+    )
+    return statistic, p
+
+
+def _permutation_p_value(kind, data, n_first, statistic, n_exact, test_type, n_resamples, block_size, alpha,
+                         early_stopping, confidence_level, n_jobs, random_state):
+    """
+    Computes the exact p-value by enumerating all `n_exact` resamples if possible and the Monte Carlo p-value
+    otherwise.
+    """
+    _check_test_type(test_type)
+    check_scalar(n_resamples, name="n_resamples", target_type=int, min_val=1)
+    check_scalar(block_size, name="block_size", target_type=int, min_val=1)
+    check_scalar(alpha, name="alpha", target_type=float, min_val=0, max_val=1, include_boundaries="neither")
+    check_scalar(confidence_level, name="confidence_level", target_type=float, min_val=0, max_val=1,
+                 include_boundaries="neither")
+    n_jobs = _check_n_jobs(n_jobs)
+
+    if n_exact <= n_resamples:
+        counts = sum(
+            _count_extreme(kind, data, n_first, statistic, block)
+            for block in _exact_blocks(kind, len(data), n_first, block_size)
+        )
+        return float(_p_values(*(counts / n_exact), test_type))
+
+    # Draw one seed per block and evaluate `n_jobs` blocks per round until the interval of the p-value excludes
+    # `alpha` or `n_resamples` resamples are evaluated.
+    n_blocks = -(-n_resamples // block_size)
+    seeds = _repetition_seeds(random_state, n_blocks)
+    sizes = np.minimum(block_size, n_resamples - block_size * np.arange(n_blocks))
+    counts, n_evaluated = np.zeros(2, dtype=int), 0
+    workers = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+    try:
+        for start in range(0, n_blocks, n_jobs):
+            tasks = [(kind, data, n_first, statistic, int(size), seed)
+                     for size, seed in zip(sizes[start:start + n_jobs], seeds[start:start + n_jobs])]
+            if workers is None:
+                counts += sum(_evaluate_random_block(*task) for task in tasks)
+            else:
+                counts += sum(workers.map(_evaluate_random_block, *zip(*tasks)))
+            n_evaluated += int(np.sum(sizes[start:start + n_jobs]))
+            if early_stopping and _excludes_alpha(counts, n_evaluated, test_type, alpha, confidence_level):
+                break
+    finally:
+        if workers is not None:
+            workers.shutdown()
+
+    # The observed data is counted as one of the resamples, so that the p-values are never zero.
+    return float(_p_values(*((counts + 1) / (n_evaluated + 1)), test_type))
+
+
+def _excludes_alpha(counts, n_evaluated, test_type, alpha, confidence_level):
+    """
+    Checks whether the Clopper-Pearson interval of the p-value lies completely below or above `alpha`. For two-sided
+    tests, the interval of the smaller tail probability is compared to `alpha / 2`.
+    """
+    if test_type == "two-sided":
+        n_extreme, alpha = min(counts), alpha / 2
+    else:
+        n_extreme = counts[0] if test_type == "left-tail" else counts[1]
+    tail = (1 - confidence_level) / 2
+    lower = stats.beta.ppf(tail, n_extreme, n_evaluated - n_extreme + 1) if n_extreme > 0 else 0.0
+    upper = stats.beta.ppf(1 - tail, n_extreme + 1, n_evaluated - n_extreme) if n_extreme < n_evaluated else 1.0
+    return upper < alpha or lower > alpha
+
+
+def _exact_blocks(kind, n_samples, n_first, block_size):
+    """
+    Yields all sign flips or group assignments in blocks of at most `block_size` rows.
+    """
+    if kind == "paired":
+        for start in range(0, 2 ** n_samples, block_size):
+            codes = np.arange(start, min(start + block_size, 2 ** n_samples), dtype=np.int64)
+            yield 1 - 2 * ((codes[:, np.newaxis] >> np.arange(n_samples)) & 1).astype(float)
+        return
+    subsets = combinations(range(n_samples), n_first)
+    while True:
+        rows = np.array(list(islice(subsets, block_size)), dtype=np.intp).reshape(-1, n_first)
+        if len(rows) == 0:
+            return
+        assignments = np.zeros((len(rows), n_samples))
+        np.put_along_axis(assignments, rows, 1, axis=1)
+        yield assignments
+
+
+def _evaluate_random_block(kind, data, n_first, statistic, block_size, seed):
+    """
+    Counts the random resamples of one block whose statistic is at most and at least the observed one.
+    """
+    random_state = check_random_state(seed)
+    if kind == "paired":
+        block = 1 - 2 * random_state.randint(2, size=(block_size, len(data))).astype(float)
+    else:
+        # The first `n_first` entries of random permutations define the first group.
+        permutations = np.argsort(random_state.random_sample((block_size, len(data))), axis=1)
+        block = np.zeros((block_size, len(data)))
+        np.put_along_axis(block, permutations[:, :n_first], 1, axis=1)
+    return _count_extreme(kind, data, n_first, statistic, block)
+
+
+def _count_extreme(kind, data, n_first, statistic, block):
+    """
+    Computes the statistics of all resamples in `block` by one matrix-vector product and counts those at most and
+    at least the observed statistic, where `block` contains sign flips or indicators of the first group.
+    """
+    if kind == "paired":
+        resampled = block @ data / len(data)
+    else:
+        sum_first = block @ data
+        resampled = sum_first / n_first - (np.sum(data) - sum_first) / (len(data) - n_first)
+
+    # A small tolerance prevents that resamples equal to the observed statistic are missed due to rounding errors.
+    tol = 1e-12 * max(1.0, abs(statistic))
+    return np.array([np.sum(resampled <= statistic + tol), np.sum(resampled >= statistic - tol)])
@@ -0,0 +1,160 @@
+import numpy as np
+
+from sklearn.utils.validation import check_scalar, column_or_1d
+
+from ._performance_measures import confusion_matrix, accuracy, cohen_kappa, macro_f1_measure
+
+
+class ConfusionMatrixAccumulator:
+    """ConfusionMatrixAccumulator
+
+    Builds a confusion matrix incrementally from batches of true and predicted class labels, such that arbitrarily
+    many predictions can be evaluated in constant memory. Accumulators of different shards, e.g., computed in
+    parallel processes, can be combined via `merge`.
+
+    Parameters
+    ----------
+    n_classes : int, default=None
+        Number of classes. If None, the confusion matrix grows with the largest class label seen so far.
+
+    Attributes
+    ----------
+    C_ : np.ndarray of shape (n_classes, n_classes)
+        Confusion matrix of all labels seen so far.
+    n_samples_ : int
+        Number of labels seen so far.
+    """
+
+    def __init__(self, n_classes=None):
+        if n_classes is not None:
+            check_scalar(n_classes, name='n_classes', target_type=int, min_val=1)
+        self.n_classes = n_classes
+        self.C_ = np.zeros((0 if n_classes is None else n_classes,) * 2, dtype=np.int64)
+        self.n_samples_ = 0
+
+    def update(self, y_true, y_pred):
+        """
+        Adds a batch of true and predicted class labels.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,)
+            Ground truth (correct) target values. Expected to be in the set `{0, ..., n_classes-1}`.
+        y_pred : array-like of shape (n_samples,)
+            Estimated targets as returned by a classifier. Expected to be in the set `{0, ..., n_classes-1}`.
+
+        Returns
+        -------
+        self : ConfusionMatrixAccumulator
+            The updated accumulator.
+        """
+        y_true = column_or_1d(y_true)
+        y_pred = column_or_1d(y_pred)
+        if len(y_true) == 0:
+            return self
+        n_classes = self.n_classes
+        if n_classes is None:
+            n_classes = max(len(self.C_), int(max(np.max(y_true), np.max(y_pred)) + 1))
+        C = confusion_matrix(y_true, y_pred, n_classes=n_classes)
+        self._add(C)
+        self.n_samples_ += len(y_true)
+        return self
+
+    def merge(self, other):
+        """
+        Adds the confusion matrix of another accumulator, e.g., of another shard.
+
+        Parameters
+        ----------
+        other : ConfusionMatrixAccumulator
+            Accumulator to be merged into this accumulator.
+
+        Returns
+        -------
+        self : ConfusionMatrixAccumulator
+            The merged accumulator.
+        """
+        if not isinstance(other, ConfusionMatrixAccumulator):
+            raise TypeError('`other` must be a `ConfusionMatrixAccumulator` instance.')
+        if self.n_classes is not None and len(other.C_) > self.n_classes:
+            raise ValueError(f'`other` has {len(other.C_)} classes, but at most {self.n_classes} are expected.')
+        self._add(other.C_)
+        self.n_samples_ += other.n_samples_
+        return self
+
+    def compute(self):
+        """
+        Returns the accumulated confusion matrix.
+
+        Returns
+        -------
+        C : np.ndarray of shape (n_classes, n_classes)
+            Confusion matrix of all labels seen so far.
+        """
+        return self.C_.copy()
+
+    def _add(self, C):
+        """
+        Adds the confusion matrix `C`, where the smaller matrix is padded with zeros.
+        """
+        n_classes = max(len(self.C_), len(C))
+        if len(self.C_) < n_classes:
+            C_padded = np.zeros((n_classes, n_classes), dtype=np.int64)
+            C_padded[:len(self.C_), :len(self.C_)] = self.C_
+            self.C_ = C_padded
+        self.C_[:len(C), :len(C)] += C
+
+
+class AccuracyAccumulator(ConfusionMatrixAccumulator):
+    """AccuracyAccumulator
+
+    Accumulates batches of class labels and computes the accuracy of all labels seen so far, see `accuracy`.
+    """
+
+    def compute(self):
+        """
+        Returns the accuracy of all labels seen so far.
+
+        Returns
+        -------
+        acc : float in [0, 1]
+            Accuracy.
+        """
+        return accuracy(C=self.C_)
+
+
+class CohenKappaAccumulator(ConfusionMatrixAccumulator):
+    """CohenKappaAccumulator
+
+    Accumulates batches of class labels and computes Cohen's kappa of all labels seen so far, see `cohen_kappa`.
+    """
+
+    def compute(self):
+        """
+        Returns Cohen's kappa of all labels seen so far.
+
+        Returns
+        -------
+        kappa : float in [-1, 1]
+            The kappa statistic between -1 and 1.
+        """
+        return cohen_kappa(C=self.C_)
+
+
+class MacroF1Accumulator(ConfusionMatrixAccumulator):
+    """MacroF1Accumulator
+
+    Accumulates batches of class labels and computes the macro F1 measure of all labels seen so far, see
+    `macro_f1_measure`.
+    """
+
+    def compute(self):
+        """
+        Returns the macro F1 measure of all labels seen so far.
+
+        Returns
+        -------
+        macro_f1 : float in [0, 1]
+            The marco f1 measure between 0 and 1.
+        """
+        return macro_f1_measure(C=self.C_)
@@ -6,6 +6,7 @@ from ._latin_hypercube import *
 #from ._mc_nemar_test import *
 #from ._wilcoxon_signed_rank_test import *
 from ._halton import *
+from ._candidate_pool import *
 from ._bayesian_optimization import *
 from ._data_generator import *
 
@@ -21,6 +22,7 @@ __all__ = [
     #"_mc_nemar_test",
     #"_wilcoxon_signed_rank_test",
     "_halton",
+    "_candidate_pool",
     "_bayesian_optimization",
     "_data_generator",
     "_own_doe_method",
@@ -1,10 +1,17 @@
 import numpy as np
 
+from concurrent.futures import (
+    FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+)
 from copy import deepcopy
+from scipy.linalg import cho_solve
+from scipy.optimize import minimize
 from scipy.stats import norm
 from sklearn.utils import check_consistent_length, column_or_1d, check_scalar, check_array
 
 from ..models import GaussianProcessRegression
+from ._candidate_pool import CandidatePool
+from ._halton import halton
 
 
 def acquisition_pi(mu, sigma, tau):
@@ -96,7 +103,8 @@ def acquisition_ucb(mu, sigma, kappa):
     return ucb_scores
 
 
-def perform_bayesian_optimization(X_cand, gpr, acquisition_func, obj_func, n_evals, n_random_init, random_state=42):
+def perform_bayesian_optimization(X_cand, gpr, acquisition_func, obj_func, n_evals, n_random_init, random_state=42,
+                                  batch_size=1, n_jobs=None, executor='thread', kappa=1.0):
     """
     Perform Bayesian optimization according to a specified acquisition function for given Gaussian
     process model, objective function, and maximum number of function evaluations.
@@ -116,6 +124,17 @@ def perform_bayesian_optimization(X_cand, gpr, acquisition_func, obj_func, n_eva
     n_random_init : int
         Number of samples to be randomly acquired for initialization. Subsequently, the acquisition
         function will be used to select samples.
+    batch_size : int, default=1
+        Number of samples selected per round. The samples of a batch are selected one after another according to
+        the kriging believer strategy, i.e., the Gaussian process is temporarily updated with its mean prediction
+        as fantasized objective value of each selected sample.
+    n_jobs : int, default=None
+        Number of workers evaluating the objective function concurrently. If None or 1, the objective function is
+        evaluated sequentially.
+    executor : 'thread' or 'process', default='thread'
+        Type of the pool of workers. A process pool requires `obj_func` to be picklable.
+    kappa : float, default=1.0
+        Weight of the standard deviation in the acquisition function 'ucb'.
 
     Returns
     -------
@@ -137,47 +156,368 @@ def perform_bayesian_optimization(X_cand, gpr, acquisition_func, obj_func, n_eva
         n_evals, name='n_evals', target_type=int, min_val=1, max_val=len(X_cand)-1
     )
     check_scalar(
-        n_evals, name='n_random_init', target_type=int, min_val=1, max_val=len(X_cand)-1
+        n_random_init, name='n_random_init', target_type=int, min_val=1, max_val=n_evals
     )
+    check_scalar(batch_size, name='batch_size', target_type=int, min_val=1)
+    check_scalar(kappa, name='kappa', target_type=float, min_val=0)
 
     # Perform Bayesian optimization until `n_evals` have been performed.
     rand_state = np.random.RandomState(random_state)
-    X_cand_is_acquired = np.zeros(len(X_cand), dtype=bool)
+    pool = CandidatePool(X_cand, metrics_dict=gpr.metrics_dict, max_acquisitions=n_evals)
     X_acquired = []
     y_acquired = []
-    
+
+    with _make_executor(executor, n_jobs) as workers:
+        # n_random_init
+        random_selected_idx = rand_state.choice(len(X_cand), size=n_random_init, replace=False)
+        [pool.acquire(idx) for idx in random_selected_idx]
+        [X_acquired.append(X_cand[idx]) for idx in random_selected_idx]
+        y_acquired.extend(_evaluate(obj_func, X_cand[random_selected_idx], workers))
+
+        # fit gpr on initial samples
+        if n_random_init < n_evals:
+            gpr.fit(X_acquired, y_acquired)
+
+        # n_evals
+        while len(y_acquired) < n_evals:
+            # select a batch of candidates, where the samples of the batch are fantasized with their mean predictions
+            q = min(batch_size, n_evals - len(y_acquired))
+            gpr_believer = deepcopy(gpr) if q > 1 else gpr
+            tau = np.max(y_acquired)
+            batch_idx = []
+            for j in range(q):
+                # predict from the cached kernel values of the remaining candidates
+                cand_idx = pool.unacquired()
+                K, k_diag = pool.kernel(cand_idx)
+                mu, sigma = gpr_believer.predict_from_kernel(K, k_diag=k_diag, return_std=True)
+
+                # find candidates according to acq func score
+                scores = _acquisition_scores(acquisition_func, mu, sigma, tau, kappa=kappa)
+                best = np.argmax(scores)
+                batch_idx.append(cand_idx[best])
+                pool.acquire(cand_idx[best])
+                if j < q - 1:
+                    gpr_believer.partial_fit(X_cand[cand_idx[best:best + 1]], mu[best:best + 1])
+
+            # evaluate the batch and append lists
+            y_batch = _evaluate(obj_func, X_cand[batch_idx], workers)
+            X_acquired.extend(X_cand[batch_idx])
+            y_acquired.extend(y_batch)
+
+            # update gpr with the new samples only
+            gpr.partial_fit(X_cand[batch_idx], y_batch)
+
+    return np.array(X_acquired), np.array(y_acquired)
+
+
+def perform_async_bayesian_optimization(X_cand, gpr, acquisition_func, obj_func, n_evals, n_random_init, n_workers,
+                                        random_state=42, executor='thread', kappa=1.0):
+    """
+    Perform asynchronous Bayesian optimization, which keeps `n_workers` workers busy. Whenever an evaluation of the
+    objective function finishes, the Gaussian process is updated with the obtained objective value and a new sample
+    is proposed. Samples whose evaluations are still pending are treated according to the kriging believer strategy,
+    i.e., the Gaussian process is temporarily updated with their mean predictions as fantasized objective values, so
+    that they are not proposed again.
+
+    Parameters
+    ----------
+    X_cand : array-like of shape (n_samples, n_features)
+        Candidate samples that can be selected for function evaluation.
+    gpr : e2ml.models.GaussianProcessRegression
+        Gaussian process as surrogate probabilistic model.
+    acquisition_func : 'pi' or 'ei' or 'ucb'
+        Specifies one of the three available acquisition functions for selecting samples.
+    obj_func : callable
+        Takes samples of `X_cand` as input to evaluate objective values.
+    n_evals : int
+        Number of samples to be acquired, i.e., selected for evaluation.
+    n_random_init : int
+        Number of samples to be randomly acquired for initialization. Subsequently, the acquisition
+        function will be used to select samples.
+    n_workers : int
+        Number of workers evaluating the objective function concurrently.
+    executor : 'thread' or 'process', default='thread'
+        Type of the pool of workers. A process pool requires `obj_func` to be picklable.
+    kappa : float, default=1.0
+        Weight of the standard deviation in the acquisition function 'ucb'.
+
+    Returns
+    -------
+    X_acquired : numpy.ndarray (n_evals, n_features)
+        Acquired, i.e., selected for evaluation, samples in the order of their finished evaluations.
+    y_acquired : numpy.ndarray (n_evals,)
+        Obtained objective function values for acquired samples.
+    """
+    # Check parameters.
+    if not isinstance(gpr, GaussianProcessRegression):
+        raise TypeError('`gpr` must be a `e2ml.models.GaussianProcessRegression` instance.')
+    gpr = deepcopy(gpr)
+    if not callable(obj_func):
+        raise TypeError('`obj_func` must be a callable.')
+    if not acquisition_func in ['pi', 'ei', 'ucb']:
+        raise ValueError("`acquisition_func` must be in `['pi', 'ei', 'ucb']`.")
+    X_cand = check_array(X_cand)
+    check_scalar(
+        n_evals, name='n_evals', target_type=int, min_val=1, max_val=len(X_cand)-1
+    )
+    check_scalar(
+        n_random_init, name='n_random_init', target_type=int, min_val=1, max_val=n_evals
+    )
+    check_scalar(n_workers, name='n_workers', target_type=int, min_val=1)
+    check_scalar(kappa, name='kappa', target_type=float, min_val=0)
+
+    # Perform Bayesian optimization until `n_evals` have been performed.
+    rand_state = np.random.RandomState(random_state)
+    pool = CandidatePool(X_cand, metrics_dict=gpr.metrics_dict, max_acquisitions=n_evals)
+    random_selected_idx = list(rand_state.choice(len(X_cand), size=n_random_init, replace=False))
+    X_acquired = []
+    y_acquired = []
+    finished_cols = []
+    pending = {}
+
+    def propose():
+        # Update a copy of gpr with fantasized objective values of the pending samples.
+        pending_idx = [idx for idx, _ in pending.values()]
+        pending_cols = [col for _, col in pending.values()]
+        gpr_believer = gpr
+        if pending:
+            gpr_believer = deepcopy(gpr)
+            K_pending, _ = pool.kernel(pending_idx, cols=finished_cols)
+            gpr_believer.partial_fit(X_cand[pending_idx], gpr.predict_from_kernel(K_pending))
+
+        # Predict from the cached kernel values of the remaining candidates, where the kernel columns are ordered
+        # like the training samples of `gpr_believer`.
+        cand_idx = pool.unacquired()
+        K, k_diag = pool.kernel(cand_idx, cols=finished_cols + pending_cols)
+        mu, sigma = gpr_believer.predict_from_kernel(K, k_diag=k_diag, return_std=True)
+        scores = _acquisition_scores(acquisition_func, mu, sigma, np.max(y_acquired), kappa=kappa)
+        return cand_idx[np.argmax(scores)]
+
+    with _make_executor(executor, n_workers) as workers:
+        n_submitted = 0
+        while len(y_acquired) < n_evals:
+            # Fill idle workers with random samples first and proposed samples afterwards.
+            while len(pending) < n_workers and n_submitted < n_evals:
+                if random_selected_idx:
+                    idx = random_selected_idx.pop(0)
+                elif y_acquired:
+                    idx = propose()
+                else:
+                    break
+                col = pool.acquire(idx)
+                pending[workers.submit(obj_func, X_cand[idx])] = (idx, col)
+                n_submitted += 1
+
+            # Update gpr with all evaluations finished in the meantime.
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, col = pending.pop(future)
+                X_acquired.append(X_cand[idx])
+                y_acquired.append(future.result())
+                finished_cols.append(col)
+                gpr.partial_fit(X_cand[idx:idx + 1], y_acquired[-1:])
+
+    return np.array(X_acquired), np.array(y_acquired)
+
+
+def perform_continuous_bayesian_optimization(bounds, gpr, acquisition_func, obj_func, n_evals, n_random_init,
+                                             n_restarts=10, random_state=42, kappa=1.0):
+    """
+    Perform Bayesian optimization over a continuous, box-constrained search space. Instead of scoring an enumerated
+    candidate set, the acquisition function is maximized via multi-start L-BFGS-B, where the starting points are
+    the next samples of a scrambled Halton sequence and the best sample acquired so far. For RBF and linear kernels,
+    the gradients of the acquisition function with respect to the sample are computed analytically. Otherwise, they
+    are approximated via finite differences.
+
+    Parameters
+    ----------
+    bounds : array-like of shape (n_features, 2)
+        `bounds[d, 0]` is the minimum and `bounds[d, 1]` the maximum value for dimension `d`.
+    gpr : e2ml.models.GaussianProcessRegression
+        Gaussian process as surrogate probabilistic model.
+    acquisition_func : 'pi' or 'ei' or 'ucb'
+        Specifies one of the three available acquisition functions for selecting samples.
+    obj_func : callable
+        Takes a sample of shape (n_features,) as input to evaluate its objective value.
+    n_evals : int
+        Number of samples to be acquired, i.e., selected for evaluation.
+    n_random_init : int
+        Number of samples to be drawn uniformly at random for initialization. Subsequently, the acquisition
+        function will be used to select samples.
+    n_restarts : int, default=10
+        Number of starting points for the maximization of the acquisition function.
+    kappa : float, default=1.0
+        Weight of the standard deviation in the acquisition function 'ucb'.
+
+    Returns
+    -------
+    X_acquired : numpy.ndarray (n_evals, n_features)
+        Acquired, i.e., selected for evaluation, samples.
+    y_acquired : numpy.ndarray (n_evals,)
+        Obtained objective function values for acquired samples.
+    """
+    # Check parameters.
+    if not isinstance(gpr, GaussianProcessRegression):
+        raise TypeError('`gpr` must be a `e2ml.models.GaussianProcessRegression` instance.')
+    gpr = deepcopy(gpr)
+    if not callable(obj_func):
+        raise TypeError('`obj_func` must be a callable.')
+    if not acquisition_func in ['pi', 'ei', 'ucb']:
+        raise ValueError("`acquisition_func` must be in `['pi', 'ei', 'ucb']`.")
+    bounds = check_array(bounds)
+    if bounds.shape[1] != 2 or np.any(bounds[:, 0] > bounds[:, 1]):
+        raise ValueError("`bounds` must have shape `(n_features, 2)` with `bounds[:, 0] <= bounds[:, 1]`.")
+    check_scalar(n_evals, name='n_evals', target_type=int, min_val=1)
+    check_scalar(n_random_init, name='n_random_init', target_type=int, min_val=1, max_val=n_evals)
+    check_scalar(n_restarts, name='n_restarts', target_type=int, min_val=1)
+    check_scalar(kappa, name='kappa', target_type=float, min_val=0)
+
     # n_random_init
-    random_selected_idx = rand_state.choice(len(X_cand), size=n_random_init)
-    X_cand_is_acquired[random_selected_idx] = True
-    [X_acquired.append(X_cand[idx]) for idx in random_selected_idx]
-    [y_acquired.append(obj_func(X_cand[idx])) for idx in random_selected_idx]
-
-    # n_evals
-    for _ in range(n_random_init, n_evals):
-        # fit gpr
+    rand_state = np.random.RandomState(random_state)
+    X_acquired = list(rand_state.uniform(bounds[:, 0], bounds[:, 1], size=(n_random_init, len(bounds))))
+    y_acquired = [obj_func(x) for x in X_acquired]
+
+    # fit gpr on initial samples
+    if n_random_init < n_evals:
         gpr.fit(X_acquired, y_acquired)
 
-        # predict
-        mu, sigma = gpr.predict(X_cand[~X_cand_is_acquired], return_std=True)
-        
-        # compute tau
+    # n_evals, where each iteration starts from the next `n_restarts` samples of a scrambled Halton sequence and
+    # from the best sample acquired so far
+    halton_seed = rand_state.randint(np.iinfo(np.int32).max)
+    for i in range(n_evals - n_random_init):
         tau = np.max(y_acquired)
-        
-        # evaluate acquisition function
-        scores = []
+        x_best = X_acquired[int(np.argmax(y_acquired))]
+        X_starts = halton(
+            n_restarts, len(bounds), bounds=bounds, skip=i * n_restarts, scramble=True, random_state=halton_seed
+        )
+        x_new = _maximize_acquisition(gpr, acquisition_func, tau, kappa, bounds, np.vstack((X_starts, x_best)))
+        X_acquired.append(x_new)
+        y_acquired.append(obj_func(x_new))
+
+        # update gpr with the new sample only
+        gpr.partial_fit(X_acquired[-1:], y_acquired[-1:])
+
+    return np.array(X_acquired), np.array(y_acquired)
+
+
+def _maximize_acquisition(gpr, acquisition_func, tau, kappa, bounds, X_starts):
+    """
+    Maximizes the acquisition function via L-BFGS-B starting from each sample in `X_starts` and returns the best
+    found sample. The scores are computed by the acquisition functions, whose gradients are added via the chain rule.
+    """
+    metric = gpr.metrics_dict_.get('metric', 'linear')
+    use_gradient = metric in ['rbf', 'linear']
+
+    def neg_acquisition(x):
+        if use_gradient:
+            mu, sigma, d_mu, d_sigma = _predict_with_gradient(gpr, x)
+        else:
+            mu, sigma = gpr.predict(x[np.newaxis], return_std=True)
+            mu, sigma = mu[0], sigma[0]
+            d_mu = d_sigma = np.zeros_like(x)
+        sigma = max(sigma, 1e-12)
+        score = _acquisition_scores(acquisition_func, [mu], [sigma], tau, kappa)[0]
+        if not use_gradient:
+            return -score
+
+        # Apply the chain rule to the acquisition function with respect to `mu` and `sigma`.
+        z = (mu - tau) / sigma
         if acquisition_func == 'pi':
-            scores = acquisition_pi(mu, sigma, tau)
+            d_score = norm.pdf(z) * (d_mu - z * d_sigma) / sigma
         elif acquisition_func == 'ei':
-            scores = acquisition_ei(mu, sigma, tau)
-        elif acquisition_func == 'ucb':
-            scores = acquisition_ucb(mu, sigma, kappa=float(random_state))
-        
-        # find candidates according to acq func score
-        acq_func_selected_idx = np.argmax(scores)
-        
-        # append lists
-        X_cand_is_acquired[acq_func_selected_idx] = True
-        X_acquired.append(X_cand[acq_func_selected_idx])
-        y_acquired.append(obj_func(X_cand[acq_func_selected_idx]))
+            d_score = norm.cdf(z) * d_mu + norm.pdf(z) * d_sigma
+        else:
+            d_score = d_mu + kappa * d_sigma
+        return -score, -d_score
 
-    return np.array(X_acquired), np.array(y_acquired)
+    x_best, score_best = None, np.inf
+    for x_start in X_starts:
+        res = minimize(neg_acquisition, x_start, method='L-BFGS-B', jac=use_gradient, bounds=bounds)
+        if res.fun < score_best:
+            x_best, score_best = np.clip(res.x, bounds[:, 0], bounds[:, 1]), res.fun
+    return x_best
+
+
+def _predict_with_gradient(gpr, x):
+    """
+    Computes the mean and standard deviation predicted by `gpr` for the single sample `x` together with their
+    gradients with respect to `x`. Only RBF and linear kernels are supported.
+    """
+    metric = gpr.metrics_dict_.get('metric', 'linear')
+    diff = x - gpr.X_
+    if metric == 'rbf':
+        gamma = gpr.metrics_dict_.get('gamma', None)
+        gamma = 1.0 / len(x) if gamma is None else gamma
+        k = np.exp(-gamma * np.einsum('ij,ij->i', diff, diff))
+        d_k = -2 * gamma * diff * k[:, np.newaxis]
+        c, d_c = 1.0, np.zeros_like(x)
+    else:
+        k = gpr.X_ @ x
+        d_k = gpr.X_
+        c, d_c = x @ x, 2 * x
+
+    # Compute `C_N^{-1} k` and the weights of the mean predictions.
+    if gpr.solver == 'cholesky':
+        w = cho_solve((gpr.L_, True), k)
+        alpha = gpr.alpha_
+    else:
+        w = gpr.C_N_inv_ @ k
+        alpha = gpr.C_N_inv_ @ gpr.y_
+
+    mu = k @ alpha
+    d_mu = d_k.T @ alpha
+    sigma = np.sqrt(max(c + gpr.beta - k @ w, 1e-24))
+    d_sigma = (d_c - 2 * d_k.T @ w) / (2 * sigma)
+    return mu, sigma, d_mu, d_sigma
+
+
+def _acquisition_scores(acquisition_func, mu, sigma, tau, kappa):
+    """
+    Evaluates the acquisition function specified by its name.
+    """
+    if acquisition_func == 'pi':
+        return acquisition_pi(mu, sigma, tau)
+    elif acquisition_func == 'ei':
+        return acquisition_ei(mu, sigma, tau)
+    elif acquisition_func == 'ucb':
+        return acquisition_ucb(mu, sigma, kappa=kappa)
+
+
+class _SequentialExecutor(Executor):
+    """
+    Executor evaluating submitted calls immediately in the calling thread.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def _make_executor(executor, n_jobs):
+    """
+    Creates the pool of workers used for evaluating the objective function.
+    """
+    if executor not in ['thread', 'process']:
+        raise ValueError("`executor` must be in `['thread', 'process']`.")
+    if n_jobs is None or n_jobs == 1:
+        return _SequentialExecutor()
+    check_scalar(n_jobs, name='n_jobs', target_type=int, min_val=1)
+    if executor == 'thread':
+        return ThreadPoolExecutor(max_workers=n_jobs)
+    return ProcessPoolExecutor(max_workers=n_jobs)
+
+
+def _evaluate(obj_func, X, workers):
+    """
+    Evaluates the objective function for all samples `X` concurrently and merges the results in the order of `X`
+    as soon as they are finished.
+    """
+    futures = {workers.submit(obj_func, x): i for i, x in enumerate(X)}
+    y = [None] * len(X)
+    for future in as_completed(futures):
+        y[futures[future]] = future.result()
+    return y
@@ -0,0 +1,114 @@
+import numpy as np
+
+from sklearn.utils import check_array, check_scalar
+from sklearn.metrics.pairwise import pairwise_kernels
+
+from ..models._gaussian_process_regression import _kernel_diag
+
+
+class CandidatePool:
+    """CandidatePool
+
+    Pool of candidate samples for Bayesian optimization, which caches the kernel values between the candidates and
+    the acquired samples. Each acquisition appends a single kernel column, such that the Gram matrix between the
+    candidates and the acquired samples is never recomputed from scratch. The prior variances `k(x, x)` of the
+    candidates are computed once without building the Gram matrix of all candidates.
+
+    Parameters
+    ----------
+    X_cand : array-like of shape (n_candidates, n_features)
+        Candidate samples that can be selected for function evaluation.
+    metrics_dict : dict, default=None
+        Parameters passed to the function `pairwise_kernels`. Must equal the `metrics_dict` of the Gaussian process
+        using this pool.
+    max_acquisitions : int, default=None
+        Expected number of acquisitions used to preallocate the kernel cache. If exceeded, the cache is grown.
+
+    Attributes
+    ----------
+    X_cand_ : numpy.ndarray of shape (n_candidates, n_features)
+        Candidate samples.
+    k_diag_ : numpy.ndarray of shape (n_candidates,)
+        Kernel values `k(x, x)` of the candidate samples.
+    is_acquired_ : numpy.ndarray of shape (n_candidates,)
+        Flags indicating whether a candidate has been acquired.
+    acquired_idx_ : list
+        Candidate indices in the order of their acquisition, i.e., `acquired_idx_[j]` belongs to the kernel column `j`.
+    """
+
+    def __init__(self, X_cand, metrics_dict=None, max_acquisitions=None):
+        self.X_cand_ = check_array(X_cand)
+        self.metrics_dict_ = {} if metrics_dict is None else metrics_dict
+        if max_acquisitions is None:
+            max_acquisitions = 16
+        check_scalar(max_acquisitions, name='max_acquisitions', target_type=int, min_val=1)
+
+        self.k_diag_ = _kernel_diag(self.X_cand_, self.metrics_dict_)
+        self.is_acquired_ = np.zeros(len(self.X_cand_), dtype=bool)
+        self.acquired_idx_ = []
+        self._K = np.empty((len(self.X_cand_), max_acquisitions))
+
+    def __len__(self):
+        return len(self.acquired_idx_)
+
+    def acquire(self, idx):
+        """
+        Mark the candidate `idx` as acquired and append its kernel column to the cache.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the acquired candidate.
+
+        Returns
+        -------
+        col : int
+            Index of the kernel column belonging to the acquired candidate.
+        """
+        idx = int(idx)
+        col = len(self.acquired_idx_)
+        if col == self._K.shape[1]:
+            K = np.empty((len(self.X_cand_), 2 * col))
+            K[:, :col] = self._K
+            self._K = K
+        self._K[:, col] = pairwise_kernels(self.X_cand_, self.X_cand_[idx:idx + 1], **self.metrics_dict_)[:, 0]
+        self.is_acquired_[idx] = True
+        self.acquired_idx_.append(idx)
+        return col
+
+    def unacquired(self):
+        """
+        Return the indices of the candidates that have not been acquired yet.
+
+        Returns
+        -------
+        idx : numpy.ndarray of shape (n_unacquired,)
+            Indices of the unacquired candidates.
+        """
+        return np.flatnonzero(~self.is_acquired_)
+
+    def kernel(self, idx=None, cols=None):
+        """
+        Return cached kernel values between candidates and acquired samples.
+
+        Parameters
+        ----------
+        idx : array-like of shape (n_samples,), default=None
+            Indices of the candidates (rows). If None, the unacquired candidates are used.
+        cols : array-like of shape (n_cols,), default=None
+            Kernel columns in the order of the training samples of the Gaussian process. If None, all columns are
+            used in the order of acquisition.
+
+        Returns
+        -------
+        K : numpy.ndarray of shape (n_samples, n_cols)
+            Gram matrix between the selected candidates and acquired samples.
+        k_diag : numpy.ndarray of shape (n_samples,)
+            Kernel values `k(x, x)` of the selected candidates.
+        """
+        idx = self.unacquired() if idx is None else np.asarray(idx, dtype=int)
+        if cols is None:
+            K = self._K[idx, :len(self.acquired_idx_)]
+        else:
+            K = self._K[np.ix_(idx, np.asarray(cols, dtype=int))]
+        return K, self.k_diag_[idx]
@@ -2,40 +2,179 @@
 The following functions serve as blackbox data generator functions.
 """
 
+import json
+import os
+
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from sklearn.neural_network import MLPClassifier
 from sklearn.datasets import make_classification
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
+from sklearn.utils import check_scalar
 
 NOISE = 0.05
 THETA = np.random.RandomState(0).randint(10, 100, 16)
 
 
 def black_box_data_generation(X):
-    learning_rate_list = np.linspace(0.05, 1, 20)[X[:, 0]]
-    batch_size_list = np.array([16, 32, 64, 128])[X[:, 1]]
-    momentum_list = np.linspace(0.05, 1, 20)[X[:, 2]]
-    hidden_layer_size_list = np.array([10, 25, 50, 75, 10])[X[:, 3]]
+    return _get_default_evaluator()(X)
+
+
+class BlackBoxEvaluator:
+    """BlackBoxEvaluator
+
+    Evaluates the black box of `black_box_data_generation`, i.e., the test accuracy of an `MLPClassifier` for
+    given coded hyperparameters. The classification data set is built only once, the design rows are distributed
+    across a pool of worker processes, and the obtained scores are memoized per design row and optionally stored
+    on disk. The pool is started with the first call evaluating several new rows and reused by later calls until
+    `close` is called, e.g., by using the evaluator as context manager.
+
+    Parameters
+    ----------
+    n_jobs : int, default=None
+        Number of worker processes. If None or 1, the rows are evaluated sequentially. Calls with a single new row
+        are always evaluated sequentially.
+    cache_path : str or None, default=None
+        Path of a file storing the memoized scores, to which the scores of new rows are appended as JSON lines. If
+        the file exists, its scores are loaded.
+
+    Attributes
+    ----------
+    cache_ : dict
+        Memoized scores, where the keys are the design rows as tuples of ints.
+    """
+
+    def __init__(self, n_jobs=None, cache_path=None):
+        if n_jobs is not None:
+            check_scalar(n_jobs, name="n_jobs", target_type=int, min_val=1)
+        self.n_jobs = n_jobs
+        self.cache_path = cache_path
+        self.cache_ = {}
+        if cache_path is not None and os.path.exists(cache_path):
+            self.cache_ = _load_cache(cache_path)
+        self._data = None
+        self._workers = None
+
+    def __call__(self, X):
+        """
+        Evaluate the design rows `X`.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, 4)
+            Coded levels of learning rate, batch size, momentum, and hidden layer size.
+
+        Returns
+        -------
+        scores : numpy.ndarray of shape (n_samples,)
+            Test accuracies of the trained `MLPClassifier` models.
+        """
+        X = np.asarray(X)
+        if X.dtype.kind not in "iub" and not np.all(X == np.round(X)):
+            raise ValueError("`X` must contain integer levels.")
+        X = X.astype(int)
+        keys = [tuple(int(v) for v in x) for x in X]
+        missing = list(dict.fromkeys(key for key in keys if key not in self.cache_))
+        if missing:
+            if self._data is None:
+                self._data = _make_black_box_data()
+            params = [_decode_black_box_row(key) for key in missing]
+            if self.n_jobs is None or self.n_jobs == 1 or len(params) == 1:
+                scores = [_train_and_score(p, self._data) for p in params]
+            else:
+                if self._workers is None:
+                    self._workers = ProcessPoolExecutor(
+                        max_workers=self.n_jobs, initializer=_init_black_box_worker, initargs=(self._data,)
+                    )
+                chunksize = max(1, len(params) // (4 * self.n_jobs))
+                scores = list(self._workers.map(_train_and_score, params, chunksize=chunksize))
+            self.cache_.update(zip(missing, scores))
+            self._append_cache(missing, scores)
+        scores = np.array([self.cache_[key] for key in keys])
+        return scores
+
+    def close(self):
+        """
+        Shut down the pool of worker processes, which is restarted by the next call evaluating several new rows.
+        """
+        if self._workers is not None:
+            self._workers.shutdown()
+            self._workers = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _append_cache(self, keys, scores):
+        """
+        Append the scores of new design rows to `self.cache_path`.
+        """
+        if self.cache_path is None:
+            return
+        with open(self.cache_path, "a") as f:
+            f.writelines(json.dumps([list(key), score]) + "\n" for key, score in zip(keys, scores))
+
+
+def _load_cache(cache_path):
+    """
+    Load memoized scores stored as JSON lines `[row, score]`.
+    """
+    cache = {}
+    with open(cache_path, "r") as f:
+        for line in f:
+            if line.strip():
+                key, score = json.loads(line)
+                cache[tuple(int(v) for v in key)] = score
+    return cache
+
+
+_DEFAULT_EVALUATOR = None
+_WORKER_DATA = None
+
+
+def _get_default_evaluator():
+    global _DEFAULT_EVALUATOR
+    if _DEFAULT_EVALUATOR is None:
+        _DEFAULT_EVALUATOR = BlackBoxEvaluator()
+    return _DEFAULT_EVALUATOR
+
+
+def _make_black_box_data():
     X, y = make_classification(n_samples=500, random_state=0)
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=0)
     scaler = StandardScaler().fit(X_train)
     X_train = scaler.transform(X_train)
     X_test = scaler.transform(X_test)
-    scores = []
-    for learning_rate, batch_size, momentum, hidden_layer_size in zip(
-        learning_rate_list, batch_size_list, momentum_list, hidden_layer_size_list
-    ):
-        mlp = MLPClassifier(
-            learning_rate_init=learning_rate,
-            batch_size=batch_size,
-            hidden_layer_sizes=hidden_layer_size,
-            max_iter=1000,
-            random_state=0,
-        )
-        scores.append(mlp.fit(X_train, y_train).score(X_test, y_test))
-    scores = np.array(scores)
-    return scores
+    return X_train, X_test, y_train, y_test
+
+
+def _decode_black_box_row(x):
+    learning_rate = np.linspace(0.05, 1, 20)[x[0]]
+    batch_size = np.array([16, 32, 64, 128])[x[1]]
+    momentum = np.linspace(0.05, 1, 20)[x[2]]
+    hidden_layer_size = np.array([10, 25, 50, 75, 10])[x[3]]
+    return learning_rate, batch_size, momentum, hidden_layer_size
+
+
+def _init_black_box_worker(data):
+    global _WORKER_DATA
+    _WORKER_DATA = data
+
+
+def _train_and_score(params, data=None):
+    X_train, X_test, y_train, y_test = _WORKER_DATA if data is None else data
+    learning_rate, batch_size, momentum, hidden_layer_size = params
+    mlp = MLPClassifier(
+        learning_rate_init=learning_rate,
+        batch_size=batch_size,
+        hidden_layer_sizes=hidden_layer_size,
+        max_iter=1000,
+        random_state=0,
+    )
+    return float(mlp.fit(X_train, y_train).score(X_test, y_test))
 
 
 def get_hotellings_experiment_measurements(X):
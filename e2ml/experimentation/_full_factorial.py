@@ -4,6 +4,8 @@ This code implement a full factorial approach.
 
 import numpy as np
 
+from sklearn.utils import check_scalar, check_random_state, column_or_1d
+
 
 def full_fac(levels):
     """
@@ -51,6 +53,182 @@ def full_fac(levels):
                [ 1.,  3.,  2.]])
     """
     # Previously implemented in _own_doe_method.py as it was not yet known
-    X = np.array(np.meshgrid(*[np.arange(0, level) for level in levels])).T.reshape(-1, len(levels))
+    X = np.asarray(FullFactorialDesign(levels))
 
     return X.astype(int)
+
+
+class FullFactorialDesign:
+    """FullFactorialDesign
+
+    Lazy full-factorial design, whose rows are decoded on demand from their integer indices via mixed-radix
+    decoding instead of materializing the whole design. The rows are ordered like the rows of `full_fac`. The design
+    can be indexed by integers, slices, integer arrays, and boolean masks of shape (len(design),).
+
+    Parameters
+    ----------
+    levels : array-like of shape (n_factors,)
+        Integer array indicating the number of levels of each input design factor (variable).
+    step_size : int, default=1
+        Only every `step_size`-th level of each factor is used, i.e., factor `f` takes the coded levels
+        `0, step_size, 2 * step_size, ...` smaller than `levels[f]`.
+
+    Attributes
+    ----------
+    levels_ : numpy.ndarray of shape (n_factors,)
+        Number of levels of each factor.
+    n_values_ : numpy.ndarray of shape (n_factors,)
+        Number of used levels of each factor.
+    dtype_ : numpy.dtype
+        Smallest integer data type which fits all coded levels.
+
+    Example
+    -------
+    ::
+
+        >>> design = FullFactorialDesign([2, 4, 3])
+        >>> len(design)
+        24
+        >>> design[5]
+        array([1, 1, 0], dtype=uint8)
+        >>> for X_batch in design.batches(batch_size=10):
+        ...     X_batch.shape
+        (10, 3)
+        (10, 3)
+        (4, 3)
+    """
+
+    def __init__(self, levels, step_size=1):
+        self.levels_ = column_or_1d(levels).astype(np.int64)
+        if len(self.levels_) == 0 or np.any(self.levels_ < 1):
+            raise ValueError("`levels` must contain at least one positive integer.")
+        self.step_size = check_scalar(step_size, name='step_size', target_type=int, min_val=1)
+        self.n_values_ = -(-self.levels_ // self.step_size)
+        self.dtype_ = np.min_scalar_type(int(np.max((self.n_values_ - 1) * self.step_size)))
+
+        # Factors in the order of increasing significance, which corresponds to the row order of `np.meshgrid`.
+        self._radix_order = np.arange(len(self.levels_))
+        if len(self.levels_) > 1:
+            self._radix_order[:2] = [1, 0]
+        self._n_rows = int(np.prod([int(n) for n in self.n_values_]))
+
+    def __len__(self):
+        return self._n_rows
+
+    @property
+    def shape(self):
+        return self._n_rows, len(self.levels_)
+
+    def __getitem__(self, key):
+        if isinstance(key, (bool, np.bool_)):
+            raise IndexError("Boolean scalars are not supported as indices of a design.")
+        if isinstance(key, (int, np.integer)):
+            if not -self._n_rows <= key < self._n_rows:
+                raise IndexError(f"Index {key} is out of bounds for a design with {self._n_rows} rows.")
+            return self.rows([key % self._n_rows])[0]
+        if isinstance(key, slice):
+            return self.rows(np.arange(*key.indices(self._n_rows), dtype=np.int64))
+        key = np.asarray(key)
+        if key.dtype == bool:
+            if key.shape != (self._n_rows,):
+                raise IndexError(
+                    f"Boolean mask of shape {key.shape} does not match a design with {self._n_rows} rows."
+                )
+            key = np.flatnonzero(key)
+        return self.rows(key)
+
+    def __array__(self, dtype=None):
+        X = self.rows(np.arange(self._n_rows, dtype=np.int64))
+        return X if dtype is None else X.astype(dtype)
+
+    def __iter__(self):
+        for X_batch in self.batches():
+            yield from X_batch
+
+    def rows(self, indices):
+        """
+        Decode the rows with the given indices.
+
+        Parameters
+        ----------
+        indices : array-like of shape (n_rows,)
+            Row indices in `{-len(self), ..., len(self) - 1}`.
+
+        Returns
+        -------
+        X : numpy.ndarray of shape (n_rows, n_factors)
+            Design rows with coded levels.
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            raise IndexError("`indices` must be integers, boolean masks are only supported by indexing the design.")
+        indices = indices.astype(np.int64).ravel()
+        if np.any(indices < -self._n_rows) or np.any(indices >= self._n_rows):
+            raise IndexError(f"Indices are out of bounds for a design with {self._n_rows} rows.")
+        indices = indices % self._n_rows
+        X = np.empty((len(indices), len(self.levels_)), dtype=self.dtype_)
+        for f in self._radix_order:
+            indices, X[:, f] = np.divmod(indices, self.n_values_[f])
+        if self.step_size > 1:
+            X *= self.dtype_.type(self.step_size)
+        return X
+
+    def batches(self, batch_size=1024, start=0, stop=None):
+        """
+        Iterate over consecutive rows of the design in batches, e.g., to process a shard `[start, stop)` of the
+        design on a worker.
+
+        Parameters
+        ----------
+        batch_size : int, default=1024
+            Maximum number of rows per batch.
+        start : int, default=0
+            Index of the first row.
+        stop : int, default=None
+            Index after the last row. If None, all rows from `start` on are used.
+
+        Yields
+        ------
+        X_batch : numpy.ndarray of shape (n_batch_rows, n_factors)
+            Design rows of the current batch.
+        """
+        check_scalar(batch_size, name='batch_size', target_type=int, min_val=1)
+        stop = self._n_rows if stop is None else min(stop, self._n_rows)
+        for batch_start in range(start, stop, batch_size):
+            yield self.rows(np.arange(batch_start, min(batch_start + batch_size, stop), dtype=np.int64))
+
+    def sample(self, n_samples, random_state=None, return_indices=False):
+        """
+        Draw rows uniformly at random without replacement.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of rows to be drawn.
+        random_state : int, RandomState instance or None, default=None
+            Controls the drawn rows.
+        return_indices : bool, default=False
+            If True, the indices of the drawn rows are returned, too.
+
+        Returns
+        -------
+        X : numpy.ndarray of shape (n_samples, n_factors)
+            Drawn design rows.
+        indices : numpy.ndarray of shape (n_samples,)
+            Indices of the drawn rows. Only returned if `return_indices=True`.
+        """
+        check_scalar(n_samples, name='n_samples', target_type=int, min_val=0, max_val=self._n_rows)
+        random_state = check_random_state(random_state)
+        if 2 * n_samples > self._n_rows:
+            indices = random_state.permutation(self._n_rows)[:n_samples]
+        else:
+            # Draw indices until enough distinct ones are found, which only requires memory proportional to
+            # `n_samples` instead of `len(self)`.
+            indices = np.unique(random_state.randint(0, self._n_rows, size=n_samples, dtype=np.int64))
+            while len(indices) < n_samples:
+                n_missing = n_samples - len(indices)
+                new_indices = random_state.randint(0, self._n_rows, size=n_missing, dtype=np.int64)
+                indices = np.unique(np.concatenate((indices, new_indices)))
+            indices = random_state.permutation(indices)
+        X = self.rows(indices)
+        return (X, indices) if return_indices else X
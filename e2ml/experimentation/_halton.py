@@ -1,10 +1,10 @@
 import numpy as np
 
-from sklearn.utils import check_scalar, check_array
+from sklearn.utils import check_scalar, check_array, check_random_state
 
 
-def van_der_corput_sequence(n_max, base=2):
-    """Generate van der Corput sequence for 1 <= n <= n_max and given base.
+def van_der_corput_sequence(n_max, base=2, start=1, permutations=None):
+    """Generate van der Corput sequence for start <= n < start + n_max and given base.
 
     Parameters
     ----------
@@ -12,26 +12,41 @@ def van_der_corput_sequence(n_max, base=2):
         Number of elements of the sequence.
     base : int
         Base of the sequence.
+    start : int, default=1
+        Index of the first element of the sequence.
+    permutations : None or array-like of shape (n_digits, base), default=None
+        Digit permutations for scrambling, where `permutations[j]` permutes the `j`-th digit. Only the first
+        `n_digits` digits of each element are taken into account. If None, no scrambling is applied.
 
     Returns
     -------
     sequence : numpy.ndarray of shape (n_max,)
-        Generate van der Corput sequence for 1 <= n <= n_max and given base.
+        Generate van der Corput sequence for start <= n < start + n_max and given base.
     """
     # Check parameters.
     check_scalar(n_max, name="n_max", target_type=int, min_val=1)
-    check_scalar(base, name="base", target_type=int, min_val=2)
-
-    sequence = []
-    for i in range(1, n_max + 1):
-        n_th_num, denom = 0.0, 1.0
-        while i > 0:
-            i, remainder = divmod(i, base)
-            denom *= base
-            n_th_num += remainder / denom
-        sequence.append(n_th_num)
-        
-    return np.array(sequence)
+    check_scalar(base, name="base", target_type=(int, np.integer), min_val=2)
+    check_scalar(start, name="start", target_type=(int, np.integer), min_val=0)
+    if permutations is not None:
+        permutations = check_array(permutations, dtype=int)
+        if permutations.shape[1] != base:
+            raise ValueError("`permutations` must have shape `(n_digits, base)`.")
+
+    # Process the digits of all indices at once, starting with the least significant digit.
+    indices = np.arange(start, start + n_max, dtype=np.int64)
+    sequence = np.zeros(n_max)
+    scale = 1.0 / base
+    n_digits = len(permutations) if permutations is not None else np.inf
+    j = 0
+    while j < n_digits and (permutations is not None or np.any(indices > 0)):
+        indices, remainder = np.divmod(indices, base)
+        if permutations is not None:
+            remainder = permutations[j][remainder]
+        sequence += remainder * scale
+        scale /= base
+        j += 1
+
+    return sequence
 
 
 def primes_from_2_to(n_max):
@@ -50,11 +65,17 @@ def primes_from_2_to(n_max):
     # Check parameters.
     check_scalar(n_max, name="n_max", target_type=int, min_val=2)
 
-    prime_numbers = [p for p in range(2, n_max + 1) if 0 not in [p % d for d in range(2, int(np.sqrt(p)) + 1)]]
+    # Sieve of Eratosthenes.
+    is_prime = np.ones(n_max + 1, dtype=bool)
+    is_prime[:2] = False
+    for p in range(2, int(np.sqrt(n_max)) + 1):
+        if is_prime[p]:
+            is_prime[p * p::p] = False
+    prime_numbers = np.flatnonzero(is_prime)
     return prime_numbers
 
 
-def halton_unit(n_samples, n_dimensions):
+def halton_unit(n_samples, n_dimensions, skip=0, scramble=False, random_state=None):
     """Generate a specified number of samples according to a Halton sequence in the unit hypercube.
 
     Parameters
@@ -63,6 +84,12 @@ def halton_unit(n_samples, n_dimensions):
         Number of samples to be generated.
     n_dimensions : int
         Dimensionality of the generated samples.
+    skip : int, default=0
+        Number of leading elements of the Halton sequence to be skipped.
+    scramble : bool, default=False
+        If True, the digits of each dimension are scrambled by random permutations.
+    random_state : int, RandomState instance or None, default=None
+        Controls the permutations used for scrambling.
 
     Returns
     -------
@@ -72,21 +99,14 @@ def halton_unit(n_samples, n_dimensions):
     # Check parameters.
     check_scalar(n_samples, name="n_samples", target_type=int, min_val=1)
     check_scalar(n_dimensions, name="n_dimensions", target_type=int, min_val=1)
+    check_scalar(skip, name="skip", target_type=int, min_val=0)
 
-    # Generate primes with the number of primes equal to the number of dimensions.
-    primes = []
-    num = n_dimensions
-    while len(primes) < n_dimensions:
-        primes = primes_from_2_to(num)
-        num *= 10
-
-    primes = primes[:n_dimensions]
-
-    X = [van_der_corput_sequence(n_samples, base=p) for p in primes]
-    return np.array(X).T
+    primes = _first_primes(n_dimensions)
+    permutations = _digit_permutations(primes, random_state) if scramble else None
+    return _halton_unit(skip + 1, n_samples, primes, permutations)
 
 
-def halton(n_samples, n_dimensions, bounds=None):
+def halton(n_samples, n_dimensions, bounds=None, skip=0, scramble=False, random_state=None):
     """Generate a specified number of samples according to a Halton sequence in a user-specified hypercube.
 
     Parameters
@@ -98,6 +118,12 @@ def halton(n_samples, n_dimensions, bounds=None):
     bounds : None or array-like of shape (n_dimensions, 2)
        `bounds[d, 0]` is the minimum and `bounds[d, 1]` the maximum
        value for dimension `d`.
+    skip : int, default=0
+        Number of leading elements of the Halton sequence to be skipped.
+    scramble : bool, default=False
+        If True, the digits of each dimension are scrambled by random permutations.
+    random_state : int, RandomState instance or None, default=None
+        Controls the permutations used for scrambling.
 
     Returns
     -------
@@ -107,6 +133,92 @@ def halton(n_samples, n_dimensions, bounds=None):
     # Check parameters.
     check_scalar(n_samples, name="n_samples", target_type=int, min_val=1)
     check_scalar(n_dimensions, name="n_dimensions", target_type=int, min_val=1)
+    bounds = _check_bounds(bounds, n_dimensions)
+
+    X = halton_unit(n_samples, n_dimensions, skip=skip, scramble=scramble, random_state=random_state)
+    X = bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * X
+    return np.array(X)
+
+
+def halton_chunks(n_samples, n_dimensions, chunk_size, bounds=None, skip=0, scramble=False, random_state=None):
+    """Generate a specified number of samples according to a Halton sequence in a user-specified hypercube as
+    consecutive chunks, such that the whole design is never held in memory.
+
+    Parameters
+    ----------
+    n_samples : int
+       Number of samples to be generated.
+    n_dimensions : int
+       Dimensionality of the generated samples.
+    chunk_size : int
+       Maximum number of samples per chunk.
+    bounds : None or array-like of shape (n_dimensions, 2)
+       `bounds[d, 0]` is the minimum and `bounds[d, 1]` the maximum
+       value for dimension `d`.
+    skip : int, default=0
+        Number of leading elements of the Halton sequence to be skipped.
+    scramble : bool, default=False
+        If True, the digits of each dimension are scrambled by random permutations, which are shared by all chunks.
+    random_state : int, RandomState instance or None, default=None
+        Controls the permutations used for scrambling.
+
+    Yields
+    ------
+    X_chunk : numpy.ndarray of shape (n_chunk_samples, n_dimensions)
+       Generated samples of the current chunk.
+    """
+    # Check parameters.
+    check_scalar(n_samples, name="n_samples", target_type=int, min_val=1)
+    check_scalar(n_dimensions, name="n_dimensions", target_type=int, min_val=1)
+    check_scalar(chunk_size, name="chunk_size", target_type=int, min_val=1)
+    check_scalar(skip, name="skip", target_type=int, min_val=0)
+    bounds = _check_bounds(bounds, n_dimensions)
+
+    primes = _first_primes(n_dimensions)
+    permutations = _digit_permutations(primes, random_state) if scramble else None
+    for offset in range(0, n_samples, chunk_size):
+        X = _halton_unit(skip + offset + 1, min(chunk_size, n_samples - offset), primes, permutations)
+        yield bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * X
+
+
+def _halton_unit(start, n_samples, primes, permutations=None):
+    """
+    Generate `n_samples` elements of the Halton sequence with the given primes as bases, starting at index `start`.
+    """
+    X = np.empty((n_samples, len(primes)))
+    for d, p in enumerate(primes):
+        X[:, d] = van_der_corput_sequence(
+            n_samples, base=int(p), start=start, permutations=None if permutations is None else permutations[d]
+        )
+    return X
+
+
+def _first_primes(n_primes):
+    """
+    Generate the first `n_primes` prime numbers.
+    """
+    # Upper bound of the `n_primes`-th prime number (Rosser's theorem).
+    n_max = 15 if n_primes < 6 else int(n_primes * (np.log(n_primes) + np.log(np.log(n_primes)))) + 1
+    return primes_from_2_to(n_max)[:n_primes]
+
+
+def _digit_permutations(primes, random_state=None):
+    """
+    Generate random digit permutations for each prime number, where the number of digits suffices to reach double
+    precision.
+    """
+    random_state = check_random_state(random_state)
+    permutations = []
+    for p in primes:
+        n_digits = int(np.ceil(53 * np.log(2) / np.log(p)))
+        permutations.append(np.argsort(random_state.random_sample((n_digits, p)), axis=1))
+    return permutations
+
+
+def _check_bounds(bounds, n_dimensions):
+    """
+    Check `bounds` or create the bounds of the unit hypercube if `bounds` is None.
+    """
     if bounds is not None:
         bounds = check_array(bounds)
         if bounds.shape[0] != n_dimensions or bounds.shape[1] != 2:
@@ -114,7 +226,4 @@ def halton(n_samples, n_dimensions, bounds=None):
     else:
         bounds = np.zeros((n_dimensions, 2))
         bounds[:, 1] = 1
-
-    X = halton_unit(n_samples, n_dimensions)
-    X = bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * X
-    return np.array(X)
+    return bounds
@@ -1,13 +1,13 @@
 """
-This code provides the implementation for the latin hypercube. 
+This code provides the implementation for the latin hypercube.
 """
 
 import numpy as np
 
-from sklearn.utils import check_scalar, check_array
+from sklearn.utils import check_scalar, check_array, check_random_state
 
 
-def lat_hyp_cube_unit(n_samples, n_dimensions):
+def lat_hyp_cube_unit(n_samples, n_dimensions, random_state=None, optimization=None, n_iter=1000, p=10):
    """
    Generate a latin-hypercube design
 
@@ -19,19 +19,78 @@ def lat_hyp_cube_unit(n_samples, n_dimensions):
    n_dimensions : int
       Dimensionality of the generated samples.
 
+   random_state : int, RandomState instance or None, default=None
+      Controls the permutations and the positions of the samples within their strata.
+
+   optimization : None or 'maximin', default=None
+      If 'maximin', the space-filling property of the design is improved by swapping elements within columns, which
+      keeps the design a Latin hypercube. A swap is accepted if it reduces the Morris-Mitchell criterion
+      `phi_p = (sum_{i<j} d_ij^(-p))^(1/p)`, which is a smooth surrogate of the maximin distance criterion.
+
+   n_iter : int, default=1000
+      Number of proposed swaps if `optimization='maximin'`.
+
+   p : int, default=10
+      Exponent of the Morris-Mitchell criterion. The larger `p`, the closer the criterion is to the maximin distance.
+
    Returns
    -------
    X : np.ndarray of shape (n_samples, n_dimensions)
        An `n_samples-by-n_dimensions` design matrix whose levels are spaced between zero and one.
    """
-   X = np.zeros((n_samples, n_dimensions))
-   for i in range(n_dimensions):
-         X[:, i] = np.random.uniform(size=n_samples)
+   # Check parameters.
+   check_scalar(n_samples, name="n_samples", target_type=int, min_val=1)
+   check_scalar(n_dimensions, name="n_dimensions", target_type=int, min_val=1)
+   if optimization not in [None, 'maximin']:
+      raise ValueError("`optimization` must be in `[None, 'maximin']`.")
+   check_scalar(n_iter, name="n_iter", target_type=int, min_val=0)
+   check_scalar(p, name="p", target_type=int, min_val=1)
+   random_state = check_random_state(random_state)
+
+   # Assign each sample to one of `n_samples` strata per dimension via column-wise permutations and place it
+   # uniformly at random within its stratum.
+   strata = np.argsort(random_state.random_sample((n_samples, n_dimensions)), axis=0)
+   X = (strata + random_state.random_sample((n_samples, n_dimensions))) / n_samples
+
+   if optimization == 'maximin' and n_samples > 2:
+      X = _maximin_swaps(X, random_state, n_iter, p)
+   return X
+
+
+def _maximin_swaps(X, random_state, n_iter, p):
+   """
+   Improve the Morris-Mitchell criterion of the design `X` by greedy element swaps within columns. Each swap only
+   changes the distances of the two swapped samples, which are updated in O(n_samples * n_dimensions) without
+   computing the full distance matrix.
+   """
+   X = X.copy()
+   n_samples, n_dimensions = X.shape
+   rows = np.arange(n_samples)
+   for _ in range(n_iter):
+      # Propose to swap the elements of the rows `i` and `j` in column `k`.
+      k = random_state.randint(n_dimensions)
+      i, j = random_state.choice(n_samples, size=2, replace=False)
+
+      # Compute the squared distances of rows `i` and `j` to all other rows before and after the swap.
+      d_i = np.sum((X - X[i]) ** 2, axis=1)
+      d_j = np.sum((X - X[j]) ** 2, axis=1)
+      diff_i = (X[i, k] - X[:, k]) ** 2
+      diff_j = (X[j, k] - X[:, k]) ** 2
+      d_i_new = d_i - diff_i + diff_j
+      d_j_new = d_j - diff_j + diff_i
+
+      # The distance between rows `i` and `j` is not affected by the swap.
+      is_other = (rows != i) & (rows != j)
+      delta = np.sum(
+         d_i_new[is_other] ** (-p / 2) - d_i[is_other] ** (-p / 2)
+         + d_j_new[is_other] ** (-p / 2) - d_j[is_other] ** (-p / 2)
+      )
+      if delta < 0:
+         X[i, k], X[j, k] = X[j, k], X[i, k]
    return X
-   
 
 
-def lat_hyp_cube(n_samples, n_dimensions, bounds=None):
+def lat_hyp_cube(n_samples, n_dimensions, bounds=None, random_state=None, optimization=None, n_iter=1000, p=10):
    """
    Generate a specified number of samples according to a Latin hypercube in a user-specified bounds.
 
@@ -44,6 +103,14 @@ def lat_hyp_cube(n_samples, n_dimensions, bounds=None):
    bounds : None or array-like of shape (n_dimensions, 2)
       `bounds[d, 0]` is the minimum and `bounds[d, 1]` the maximum
       value for dimension `d`.
+   random_state : int, RandomState instance or None, default=None
+      Controls the permutations and the positions of the samples within their strata.
+   optimization : None or 'maximin', default=None
+      Optimization of the space-filling property, see `lat_hyp_cube_unit`.
+   n_iter : int, default=1000
+      Number of proposed swaps if `optimization='maximin'`.
+   p : int, default=10
+      Exponent of the Morris-Mitchell criterion.
 
    Returns
    -------
@@ -62,7 +129,7 @@ def lat_hyp_cube(n_samples, n_dimensions, bounds=None):
        bounds[:, 1] = 1
 
    # Generate samples.
-   X = lat_hyp_cube_unit(n_samples, n_dimensions)
-   for i in range(n_dimensions):
-         X[:, i] = X[:, i] * (bounds[i, 1] - bounds[i, 0]) + bounds[i, 0]
-   return X 
+   X = lat_hyp_cube_unit(
+      n_samples, n_dimensions, random_state=random_state, optimization=optimization, n_iter=n_iter, p=p
+   )
+   return bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * X
@@ -4,12 +4,17 @@ Latin hypercube with normall distribution for farther values on the sides
 
 import numpy as np
 
-from sklearn.utils import check_scalar, check_array, check_consistent_length, column_or_1d
+from scipy.stats import truncnorm
+from sklearn.utils import check_scalar, check_consistent_length, check_random_state
 
-def lat_hyp_cube_norm_dist_unit(n_samples, n_dimensions, mus, sigmas, features, _random_state=42):
+
+def lat_hyp_cube_norm_dist_unit(n_samples, n_dimensions, mus, sigmas, features, _random_state=42, bounds=None):
    """
    Generate a combination of a latin-hypercube with normall distribution
 
+   Each dimension is divided into `n_samples` strata of equal probability, and each sample is drawn from its own
+   stratum via the inverse cumulative distribution function of the (truncated) normal distribution.
+
    Parameters
    ----------
    n_samples : int
@@ -22,8 +27,18 @@ def lat_hyp_cube_norm_dist_unit(n_samples, n_dimensions, mus, sigmas, features,
       `mus[d]` is the mean value for dimension `d`.
 
    sigmas : array-like of shape (n_dimensions, 1)
-      `sigmas[d]` is the standard deviation for dimension `d`.   
-      
+      `sigmas[d]` is the standard deviation for dimension `d`.
+
+   features : array-like of shape (n_dimensions,)
+      `features[d]` is the key of dimension `d` in `mus` and `sigmas`.
+
+   _random_state : int, RandomState instance or None, default=42
+      Controls the permutations and the positions of the samples within their strata.
+
+   bounds : None or array-like of shape (n_dimensions, 2)
+      `bounds[d, 0]` is the minimum and `bounds[d, 1]` the maximum value for dimension `d`, where None denotes
+      an unbounded side. If None, all dimensions are unbounded.
+
    Returns
    -------
    X : np.ndarray of shape (n_samples, n_dimensions)
@@ -33,15 +48,18 @@ def lat_hyp_cube_norm_dist_unit(n_samples, n_dimensions, mus, sigmas, features,
    check_scalar(n_dimensions, name="n_dimensions", target_type=int, min_val=1)
    check_consistent_length(mus, sigmas)
    check_consistent_length(mus, features)
-   rand = np.random.RandomState(_random_state)
-   X = np.zeros((n_samples, n_dimensions))
-   for idx, feature in enumerate(features):
-         X[:, idx] = rand.normal(loc=mus[feature], scale=sigmas[feature], size=n_samples)
-   return X
-   
+   random_state = check_random_state(_random_state)
+   loc, scale, a, b = _truncnorm_params(n_dimensions, mus, sigmas, features, bounds)
+
+   # Draw stratified uniforms with one sample per stratum and dimension and transform them via the inverse
+   # cumulative distribution function of the truncated normal distribution.
+   strata = np.argsort(random_state.random_sample((n_samples, n_dimensions)), axis=0)
+   U = (strata + random_state.random_sample((n_samples, n_dimensions))) / n_samples
+   return truncnorm.ppf(U, a, b, loc=loc, scale=scale)
 
 
-def lat_hyp_cube_norm_dist(n_samples, n_dimensions, mus, sigmas, features, bounds=None, min_max=False, min_max_samples=100):
+def lat_hyp_cube_norm_dist(n_samples, n_dimensions, mus, sigmas, features, bounds=None, min_max=False, min_max_samples=100,
+                           random_state=42):
    """
    Generate a specified number of samples according to a Latin hypercube in a user-specified bounds.
 
@@ -58,89 +76,72 @@ def lat_hyp_cube_norm_dist(n_samples, n_dimensions, mus, sigmas, features, bound
 
    sigmas : array-like of shape (n_dimensions, 1)
       `sigmas[d]` is the standard deviation for dimension `d`.
-      
+
+   features : array-like of shape (n_dimensions,)
+      `features[d]` is the key of dimension `d` in `mus` and `sigmas`.
+
    bounds : None or array-like of shape (n_dimensions, 2)
       `bounds[d, 0]` is the minimum and `bounds[d, 1]` the maximum
-      value for dimension `d`.
+      value for dimension `d`, where None denotes an unbounded side.
+      If None, all dimensions are unbounded.
 
    min_max : bool
-      If True, the minimum and maximum values of the normal 
-      distribution must be included in the samples.
+      If True, the first and the last sample approximate the expected minimum
+      and maximum values of `min_max_samples` draws from the (truncated) normal
+      distribution of each dimension.
 
    min_max_samples : int
-      Number of samples to be generated to find the minimum and 
+      Number of samples to be generated to find the minimum and
       maximum values of the normal distribution.
 
+   random_state : int, RandomState instance or None, default=42
+      Controls the permutations and the positions of the samples within their strata.
+
    Returns
    -------
    X : numpy.ndarray of shape (n_samples, n_dimensions)
       Generated samples.
    """
-   def check_sample(sample, bounds, mus, sigmas, _random_state=42):
-         """
-         Check if a sample is valid.
-
-         Parameters
-         ----------
-         sample : array-like of shape (n_dimensions, 1)
-            Sample (roW) to be checked.
-
-         bounds : array-like of shape (n_dimensions, 2)
-            `bounds[d, 0]` is the minimum and `bounds[d, 1]` the maximum
-            value for dimension `d`.
-
-         mus : array-like of shape (n_dimensions, 1)
-            `mus[d]` is the mean value for dimension `d`.
-            
-         sigmas : array-like of shape (n_dimensions, 1)
-            `sigmas[d]` is the standard deviation for dimension `d`.
-
-         Returns
-         -------  
-         sample : array-like of shape (n_dimensions, 1)
-            Valid sample.
-         """
-         for idx, feature in enumerate(features):
-               if bounds[idx,0] is not None:
-                  if sample[idx] <= bounds[idx, 0]:
-                     sample[idx] = np.random.choice(np.random.normal(loc=mus[feature], scale=sigmas[feature], size=n_samples * 2), 1)
-                     return check_sample(sample, bounds, mus, sigmas)
-               elif bounds[idx,0] is not None:
-                  if sample[idx] >= bounds[idx, 1]:
-                        sample[idx] = np.random.choice(np.random.normal(loc=mus[feature], scale=sigmas[feature], size=n_samples * 2), 1)
-                        return check_sample(sample, bounds, mus, sigmas)
-               print(sample) if sample[idx] <= 0 else None
-         return sample
-
    # Check parameters.
-   check_scalar(n_samples, name="n_samples", target_type=int, min_val=1)
+   check_scalar(n_samples, name="n_samples", target_type=int, min_val=3 if min_max else 1)
    check_scalar(n_dimensions, name="n_dimensions", target_type=int, min_val=1)
+   check_scalar(min_max_samples, name="min_max_samples", target_type=int, min_val=1)
    check_consistent_length(mus, sigmas)
-   check_consistent_length(mus, bounds)
    check_consistent_length(mus, features)
-   if bounds is not None:
-       if bounds.shape[0] != n_dimensions or bounds.shape[1] != 2:
-           raise ValueError("`bounds` must have shape `(n_dimensions, 2)`.")
-   else:
-       bounds = np.zeros((n_dimensions, 2))
-       bounds[:, 1] = 1
 
    # Generate samples.
-   if min_max:
-      if bounds is None:
-            raise ValueError("If `min_max` is True, `bounds` must be specified.")
-      get_min = all(v is not None for v in bounds[:, 0])
-      get_max = all(v is not None for v in bounds[:, 1])
-      X = (lat_hyp_cube_norm_dist_unit(n_samples-2, n_dimensions, mus, sigmas, features) if get_min and get_max else lat_hyp_cube_norm_dist_unit(n_samples, n_dimensions, mus, sigmas, features)) if get_min or get_max else lat_hyp_cube_norm_dist_unit(n_samples, n_dimensions, mus, sigmas, features)
-      min_sample = np.zeros((1, n_dimensions))
-      max_sample = np.zeros((1, n_dimensions))
-      for idx, feature in enumerate(features):
-            dist = np.random.normal(loc=mus[feature], scale=sigmas[feature], size=min_max_samples)
-            min_sample[0, idx] = (np.min(dist) if np.min(dist) < bounds[idx, 0] else bounds[idx, 0] + 1/sigmas[feature]) if bounds[idx, 0] is not None else np.random.normal(loc=mus[feature], scale=sigmas[feature], size=1)
-            max_sample[0, idx] = (np.max(dist) if np.max(dist) > bounds[idx, 1] else bounds[idx, 1] - 1/sigmas[feature]) if bounds[idx, 1] is not None else np.random.normal(loc=mus[feature], scale=sigmas[feature], size=1)
-      X = (np.concatenate((min_sample, X, max_sample), axis=0) if get_min and get_max else np.concatenate((X, max_sample), axis=0)) if get_max else np.concatenate((min_sample, X), axis=0) if get_min else X
-   else:
-      X = lat_hyp_cube_norm_dist_unit(n_samples, n_dimensions, mus, sigmas, features)
-   for i in range(n_samples):
-         X[i, :] = check_sample(X[i, :], bounds, mus, sigmas)
-   return X 
+   if not min_max:
+      return lat_hyp_cube_norm_dist_unit(n_samples, n_dimensions, mus, sigmas, features, random_state, bounds)
+
+   # Approximate the expected minimum and maximum of `min_max_samples` draws by the quantiles
+   # `1 / (min_max_samples + 1)` and `min_max_samples / (min_max_samples + 1)`, which are the expected values of the
+   # minimum and maximum of the draws on the uniform scale.
+   X = lat_hyp_cube_norm_dist_unit(n_samples - 2, n_dimensions, mus, sigmas, features, random_state, bounds)
+   loc, scale, a, b = _truncnorm_params(n_dimensions, mus, sigmas, features, bounds)
+   q = np.array([[1], [min_max_samples]]) / (min_max_samples + 1)
+   min_sample, max_sample = truncnorm.ppf(q, a, b, loc=loc, scale=scale)
+   return np.concatenate((min_sample[np.newaxis], X, max_sample[np.newaxis]), axis=0)
+
+
+def _truncnorm_params(n_dimensions, mus, sigmas, features, bounds):
+   """
+   Compute the per-dimension parameters of `scipy.stats.truncnorm`, where the bounds are standardized.
+   """
+   loc = np.array([mus[feature] for feature in features], dtype=float)
+   scale = np.array([sigmas[feature] for feature in features], dtype=float)
+   if len(loc) != n_dimensions:
+      raise ValueError("`features` must have `n_dimensions` entries.")
+   if np.any(scale <= 0):
+      raise ValueError("`sigmas` must be positive.")
+
+   lower = np.full(n_dimensions, -np.inf)
+   upper = np.full(n_dimensions, np.inf)
+   if bounds is not None:
+      bounds = np.asarray(bounds, dtype=object)
+      if bounds.shape != (n_dimensions, 2):
+         raise ValueError("`bounds` must have shape `(n_dimensions, 2)`.")
+      lower = np.array([-np.inf if v is None else v for v in bounds[:, 0]], dtype=float)
+      upper = np.array([np.inf if v is None else v for v in bounds[:, 1]], dtype=float)
+      if np.any(lower >= upper):
+         raise ValueError("`bounds[d, 0]` must be smaller than `bounds[d, 1]`.")
+   return loc, scale, (lower - loc) / scale, (upper - loc) / scale
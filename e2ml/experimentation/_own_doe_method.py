@@ -1,6 +1,8 @@
 import numpy as np
 import math
 
+from ._full_factorial import FullFactorialDesign
+
 
 def own_doe_method(levels, step_size=1):
     """
@@ -25,6 +27,6 @@ def own_doe_method(levels, step_size=1):
     # and transform it into a matrix with one combination per row
     # (e.g. for levels = [3, 5] and step_size = 2, the matrix would be:
     # [[0, 0], [0, 2], [0, 4], [2, 0], [2, 2], [2, 4]])
-    X = np.array(np.meshgrid(*[np.arange(0, level, step_size) for level in levels])).T.reshape(-1, len(levels))
+    X = np.asarray(FullFactorialDesign(levels, step_size=step_size))
 
     return X.astype(int)
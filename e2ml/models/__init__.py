@@ -1,7 +1,9 @@
 from ._binary_logistic_regression import BinaryLogisticRegression
 from ._gaussian_process_regression import GaussianProcessRegression
+from ._multinomial_logistic_regression import MultinomialLogisticRegression
 
 __all__ = [
     'BinaryLogisticRegression',
-    'GaussianProcessRegression'
+    'GaussianProcessRegression',
+    'MultinomialLogisticRegression'
 ]
\ No newline at end of file
@@ -0,0 +1,254 @@
+import numpy as np
+
+from scipy.optimize import minimize
+
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.utils import check_array, check_random_state, column_or_1d, check_consistent_length, check_scalar
+from sklearn.preprocessing import LabelEncoder
+
+
+class _BaseLogisticRegression(BaseEstimator, ClassifierMixin):
+    """_BaseLogisticRegression
+
+    Common base of the logistic regression models, which implements the full-batch and mini-batch solvers as well as
+    `partial_fit`. Subclasses define the initial weights, the fused loss and gradient, the curvature and
+    Hessian-vector products of the solver 'newton-cg', and the class probabilities.
+    """
+
+    _solvers = {'bfgs': 'BFGS', 'lbfgs': 'L-BFGS-B', 'newton-cg': 'Newton-CG', 'sgd': None, 'adam': None}
+
+    # Decay rates of the moment estimates and numerical stabilizer of Adam.
+    _beta_1, _beta_2, _epsilon = 0.9, 0.999, 1e-8
+
+    def __init__(self, maxiter=100, lmbda=0.0, solver='bfgs', learning_rate='invscaling', learning_rate_init=0.1,
+                 power_t=0.5, batch_size=200, random_state=None):
+        self.maxiter = maxiter
+        self.lmbda = lmbda
+        self.solver = solver
+        self.learning_rate = learning_rate
+        self.learning_rate_init = learning_rate_init
+        self.power_t = power_t
+        self.batch_size = batch_size
+        self.random_state = random_state
+
+    @property
+    def classes_(self):
+        return self.label_encoder_.classes_
+
+    def fit(self, X, y):
+        """
+        Fit the model using `X` as training data and `y` as class labels.
+
+        Parameters
+        ----------
+        X: matrix-like or scipy.sparse matrix, shape (n_samples, n_features)
+            The sample matrix `X` is the feature matrix representing the samples for training. Sparse matrices and
+            float32 values are used without copies.
+        y: array-like, shape (n_samples) or (n_samples, n_outputs)
+            The array `y` contains the class labels of the training samples.
+
+        Returns
+        -------
+        self: _BaseLogisticRegression,
+            The model fitted on the training data.
+        """
+        # Check attributes.
+        self._check_params()
+        X, y = self._check_X_y(X, y, reset=True)
+
+        # Fit `LabelEncoder` object as `self.label_encoder_`.
+        self.label_encoder_ = LabelEncoder()
+        self.label_encoder_.fit(y)
+
+        # Check the number of classes.
+        self._check_classes()
+
+        # Transform `self.y_` using the fitted `self.label_encoder_`.
+        self.y_ = self.label_encoder_.transform(y)
+
+        # Initialize weights `w0`.
+        w0 = self._init_weights(X.shape[1])
+        self._init_optimizer(w0)
+
+        if self.solver in ['sgd', 'adam']:
+            # Perform mini-batch steps on the shuffled samples of each epoch.
+            random_state = check_random_state(self.random_state)
+            for _ in range(self.maxiter):
+                self._partial_fit_batches(X, self.y_, random_state.permutation(len(self.y_)))
+            return self
+
+        # Use `scipy.optimize.minimize` with the fused loss and gradient to optimize the loss function and store the
+        # result as `self.w_`.
+        self.w_ = self._minimize(w0, X, self.y_)
+
+        return self
+
+    def partial_fit(self, X, y, classes=None):
+        """
+        Update the model by mini-batch steps on the samples `X` and class labels `y`, such that data sets exceeding
+        the memory can be processed chunk by chunk.
+
+        Parameters
+        ----------
+        X: matrix-like or scipy.sparse matrix, shape (n_samples, n_features)
+            The sample matrix `X` is the feature matrix representing a chunk of the samples for training.
+        y: array-like, shape (n_samples)
+            The array `y` contains the class labels of the chunk of training samples.
+        classes: array-like, shape (n_classes), default=None
+            All class labels, which are required for the first call since a chunk may not contain all of them.
+
+        Returns
+        -------
+        self: _BaseLogisticRegression,
+            The updated model.
+        """
+        return self._partial_fit(X, y, classes, reset=not hasattr(self, 'label_encoder_'))
+
+    def fit_batches(self, batches, classes):
+        """
+        Fit the model in a single pass over an iterable of chunks, e.g., read from a CSV file or sliced from a
+        memory-mapped `.npy` file, via `partial_fit`.
+
+        Parameters
+        ----------
+        batches: iterable of tuples (X, y)
+            Chunks of samples of shape (n_samples, n_features) and class labels of shape (n_samples).
+        classes: array-like, shape (n_classes)
+            All class labels.
+
+        Returns
+        -------
+        self: _BaseLogisticRegression,
+            The model fitted on the chunks.
+        """
+        reset = True
+        for X, y in batches:
+            self._partial_fit(X, y, classes, reset=reset)
+            reset = False
+        if reset:
+            raise ValueError("`batches` must contain at least one chunk.")
+        return self
+
+    def _partial_fit(self, X, y, classes, reset):
+        """
+        Performs the mini-batch steps of `partial_fit`, where the label encoder and the optimizer are initialized if
+        `reset=True`.
+        """
+        self._check_params()
+        X, y = self._check_X_y(X, y, reset=reset)
+        if reset:
+            if classes is None:
+                raise ValueError("`classes` must be given in the first call of `partial_fit`.")
+            self.label_encoder_ = LabelEncoder()
+            self.label_encoder_.fit(column_or_1d(classes))
+            self._check_classes()
+            self._init_optimizer(self._init_weights(X.shape[1]))
+        elif classes is not None and not np.array_equal(np.unique(classes), self.label_encoder_.classes_):
+            raise ValueError("`classes` must not change between calls of `partial_fit`.")
+        self._partial_fit_batches(X, self.label_encoder_.transform(y), np.arange(len(y)))
+        return self
+
+    def _partial_fit_batches(self, X, y, order):
+        """
+        Performs one mini-batch step per `batch_size` samples in the given `order`.
+        """
+        for start in range(0, len(order), self.batch_size):
+            idx = order[start:start + self.batch_size]
+            _, gradient = self._loss_grad(self.w_, X[idx], y[idx])
+            self.t_ += 1
+            learning_rate = self.learning_rate_init
+            if self.learning_rate == 'invscaling':
+                learning_rate /= self.t_ ** self.power_t
+            if self.solver == 'adam':
+                # Update the biased first and second moment estimates and correct their bias.
+                self.m_ *= self._beta_1
+                self.m_ += (1 - self._beta_1) * gradient
+                self.v_ *= self._beta_2
+                self.v_ += (1 - self._beta_2) * gradient ** 2
+                m_hat = self.m_ / (1 - self._beta_1 ** self.t_)
+                v_hat = self.v_ / (1 - self._beta_2 ** self.t_)
+                gradient = m_hat / (np.sqrt(v_hat) + self._epsilon)
+            self.w_ -= learning_rate * gradient
+
+    def _init_optimizer(self, w):
+        """
+        Initializes the weights and the state of the mini-batch steps.
+        """
+        self.w_ = np.array(w, dtype=float)
+        self.t_ = 0
+        if self.solver == 'adam':
+            self.m_ = np.zeros_like(self.w_)
+            self.v_ = np.zeros_like(self.w_)
+
+    def _check_params(self):
+        """
+        Checks the hyperparameters.
+        """
+        check_scalar(self.maxiter, min_val=0, name='maxiter', target_type=int)
+        check_scalar(self.lmbda, min_val=0, name='lmbda', target_type=(int, float))
+        if self.solver not in self._solvers:
+            raise ValueError(f"`solver` must be in `{list(self._solvers)}`.")
+        if self.learning_rate not in ['constant', 'invscaling']:
+            raise ValueError("`learning_rate` must be in `['constant', 'invscaling']`.")
+        check_scalar(self.learning_rate_init, min_val=0, name='learning_rate_init', target_type=(int, float),
+                     include_boundaries='neither')
+        check_scalar(self.power_t, min_val=0, name='power_t', target_type=(int, float))
+        check_scalar(self.batch_size, min_val=1, name='batch_size', target_type=int)
+
+    def _check_X_y(self, X, y, reset):
+        """
+        Checks the samples `X` and the class labels `y`.
+        """
+        X = check_array(X, accept_sparse=['csr', 'csc'], dtype=[np.float64, np.float32])
+        self._check_n_features(X, reset=reset)
+        y = column_or_1d(y)
+        check_consistent_length(X, y)
+        return X, y
+
+    def _check_classes(self):
+        """
+        Checks the classes known to `self.label_encoder_`, where all numbers of classes are accepted by default.
+        """
+
+    def _minimize(self, w0, X, y):
+        """
+        Minimizes the loss with respect to the flattened weights starting at `w0` using the method `self.solver`.
+        """
+        hessp = None
+        if self.solver == 'newton-cg':
+            # The curvature only depends on the weights, so that it is computed once per Newton step and reused by
+            # all Hessian-vector products of the conjugate gradient iterations.
+            cache = [None, None]
+
+            def hessp(w, p, X, y):
+                if cache[0] is None or not np.array_equal(cache[0], w):
+                    cache[0], cache[1] = w.copy(), self._curvature(w, X)
+                return self._hessp(cache[1], p, X)
+
+        result = minimize(
+            self._loss_grad, w0, args=(X, y), method=self._solvers[self.solver], jac=True, hessp=hessp,
+            options={'maxiter': self.maxiter}
+        )
+        return result.x
+
+    def predict(self, X):
+        """
+        Return class label predictions for the test data `X`.
+
+        Parameters
+        ----------
+        X:  array-like or scipy.sparse matrix of shape (n_samples, n_features)
+            Test samples.
+
+        Returns
+        -------
+        y:  numpy.ndarray of shape = [n_samples]
+            Predicted class labels class.
+        """
+        # Predict class labels `y`.
+        y_pred = self.predict_proba(X).argmax(axis=1)
+
+        # Re-transform predicted labels using `self.label_encoder_`.
+        y = self.label_encoder_.inverse_transform(y_pred)
+
+        return y
\ No newline at end of file
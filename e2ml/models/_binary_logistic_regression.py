@@ -1,16 +1,12 @@
 import numpy as np
 
-from e2ml.evaluation import binary_cross_entropy_loss
-
 from scipy.special import expit
-from scipy.optimize import minimize
+from sklearn.utils import check_array
 
-from sklearn.base import BaseEstimator, ClassifierMixin
-from sklearn.utils import check_array, column_or_1d, check_consistent_length, check_scalar
-from sklearn.preprocessing import LabelEncoder
+from ._base_logistic_regression import _BaseLogisticRegression
 
 
-class BinaryLogisticRegression(BaseEstimator, ClassifierMixin):
+class BinaryLogisticRegression(_BaseLogisticRegression):
     """BinaryLogisticRegression
 
     Binary logistic regression (BLR) is a simple probabilistic classifier for binary classification problems.
@@ -18,97 +14,81 @@ class BinaryLogisticRegression(BaseEstimator, ClassifierMixin):
     Parameters
     ----------
     maxiter : int, default=100
-        Maximum number of optimization steps.
+        Maximum number of optimization steps. For the solvers 'sgd' and 'adam', it is the number of epochs, i.e.,
+        passes over the training data.
     lmbda: float, default=0.0
         Regularization hyperparameter.
+    solver: {'bfgs', 'lbfgs', 'newton-cg', 'sgd', 'adam'}, default='bfgs'
+        Optimization method. The methods 'bfgs', 'lbfgs', and 'newton-cg' are full-batch methods of
+        `scipy.optimize.minimize`. The method 'bfgs' stores a dense inverse Hessian of shape (n_features, n_features),
+        whereas 'lbfgs' only stores a few gradients and is recommended for many features. The method 'newton-cg'
+        solves the Newton steps, i.e., the iteratively reweighted least squares problems, via conjugate gradients
+        using Hessian-vector products. The methods 'sgd' and 'adam' perform stochastic gradient descent and Adam
+        steps on mini-batches of `batch_size` samples. `partial_fit` uses Adam if `solver='adam'` and stochastic
+        gradient descent otherwise.
+    learning_rate: {'constant', 'invscaling'}, default='invscaling'
+        Learning rate schedule of the mini-batch steps. If 'constant', the learning rate is `learning_rate_init`.
+        If 'invscaling', the learning rate of step `t` is `learning_rate_init / t**power_t`.
+    learning_rate_init: float, default=0.1
+        Initial learning rate of the mini-batch steps.
+    power_t: float, default=0.5
+        Exponent of the 'invscaling' learning rate schedule.
+    batch_size: int, default=200
+        Number of samples per mini-batch step.
+    random_state: int, RandomState instance or None, default=None
+        Determines the order of the samples in the epochs of the solvers 'sgd' and 'adam'.
 
 
     Attributes
     ----------
     w_: numpy.ndarray, shape (n_features,)
         Weights (parameters) optimized during training the BLR model.
+    t_: int
+        Number of mini-batch steps performed by the solvers 'sgd' and 'adam' or by `partial_fit`.
+    classes_: numpy.ndarray, shape (n_classes,)
+        Class labels known to `label_encoder_`.
     """
 
-    def __init__(self, maxiter=100, lmbda=0.0):
-        self.maxiter = maxiter
-        self.lmbda = lmbda
-
-    def fit(self, X, y):
+    def _init_weights(self, n_features):
         """
-        Fit the `BinaryLogisticRegression` model using `X` as training data and `y` as class labels.
-
-        Parameters
-        ----------
-        X: matrix-like, shape (n_samples, n_features)
-            The sample matrix `X` is the feature matrix representing the samples for training.
-        y: array-like, shape (n_samples) or (n_samples, n_outputs)
-            The array `y` contains the class labels of the training samples.
+        Returns the initial flattened weights.
+        """
+        return np.zeros(n_features)
 
-        Returns
-        -------
-        self: BinaryLogisticRegression,
-            The `BinaryLogisticRegression` model fitted on the training data.
+    def _check_classes(self):
+        """
+        Raises a `ValueError` if there are more than two classes.
         """
-        # Check attributes.
-        check_scalar(self.maxiter, min_val=0, name='maxiter', target_type=int)
-        check_scalar(self.lmbda, min_val=0, name='lmbda', target_type=(int, float))
-        X = check_array(X)
-        self._check_n_features(X, reset=True)
-        y = column_or_1d(y)
-        check_consistent_length(X, y)
-
-        # Fit `LabelEncoder` object as `self.label_encoder_`.
-        self.label_encoder_ = LabelEncoder()
-        self.label_encoder_.fit(y)
-
-        # Raise `ValueError` if there are more than two classes.
         if len(self.label_encoder_.classes_) > 2:
             raise ValueError("Only binary classification is supported.")
 
-        # Transform `self.y_` using the fitted `self.label_encoder_`.
-        self.y_ = self.label_encoder_.transform(y)
-
-        # Initialize weights `w0`.
-        w0 = np.zeros(X.shape[1])
-
-        def loss_func(w):
-            """
-            Compute the (scaled) loss with respect to weights `w`.
-
-            Parameters
-            ----------
-            w : np.ndarray of shape (n_features,)
-
-            Returns
-            -------
-            loss : float
-                Evaluated (scaled) loss.
-            """
-            # Compute predictions for given weights.
-            y_pred = expit(X @ w)
-
-            # Compute binary cross entropy loss including regularization.
-            loss = binary_cross_entropy_loss(y, y_pred)
-
-            loss += 0.5 * len(X)**(-1) * self.lmbda * w.T @ w
-
-            return loss
-
-        def gradient_func(w):
-            # Compute predictions for given weights.
-            y_pred = expit(X @ w)
-
-            # Compute gradient.
-            gradient = len(X)**(-1) * np.sum((y_pred - self.y_)[:, np.newaxis] * X, axis=0)
-            gradient += self.lmbda * w
-
-            return gradient
-
-        # Use `scipy.optimize.minimize` with `BFGS` as `method` to optimize the loss function and store the result as
-        # `self.w_`
-        self.w_ = minimize(loss_func, w0, method='BFGS', jac=gradient_func, options={'maxiter': self.maxiter}).x
+    def _loss_grad(self, w, X, y):
+        """
+        Computes the regularized binary cross entropy loss and its gradient with respect to the weights `w` from a
+        single product `X @ w`. The loss `log(1 + exp(z)) - y * z` of the logits `z` is evaluated via `logaddexp` to
+        avoid overflows.
+        """
+        z = X @ w
+        loss = np.mean(np.logaddexp(0, z) - y * z) + 0.5 * self.lmbda * (w @ w)
+        residuals = expit(z)
+        residuals -= y
+        residuals /= len(z)
+        gradient = X.T @ residuals
+        gradient += self.lmbda * w
+        return loss, gradient
+
+    def _curvature(self, w, X):
+        """
+        Computes the weights `sigma(z) * (1 - sigma(z)) / n_samples` of the samples in the Hessian.
+        """
+        y_pred = expit(X @ w)
+        return y_pred * (1 - y_pred) / X.shape[0]
 
-        return self
+    def _hessp(self, curvature, p, X):
+        """
+        Computes the product of the Hessian with the vector `p` without forming the Hessian.
+        """
+        return X.T @ (curvature * (X @ p)) + self.lmbda * p
 
     def predict_proba(self, X):
         """
@@ -116,7 +96,7 @@ class BinaryLogisticRegression(BaseEstimator, ClassifierMixin):
 
         Parameters
         ----------
-        X:  array-like of shape (n_samples, n_features)
+        X:  array-like or scipy.sparse matrix of shape (n_samples, n_features)
             The sample matrix `X` is the feature matrix representing the training samples.
 
         Returns
@@ -125,32 +105,10 @@ class BinaryLogisticRegression(BaseEstimator, ClassifierMixin):
             The class probabilities of the input samples. Classes are ordered by lexicographic order.
         """
         # Check `X` parameter.
-        X = check_array(X)
+        X = check_array(X, accept_sparse=['csr', 'csc'], dtype=[np.float64, np.float32])
         self._check_n_features(X, reset=False)
 
         # Estimate and return conditional class probabilities.
         y_pred = expit(X @ self.w_)
         P = np.column_stack((1 - y_pred, y_pred))
         return P
-
-    def predict(self, X):
-        """
-        Return class label predictions for the test data `X`.
-
-        Parameters
-        ----------
-        X:  array-like of shape (n_samples, n_features)
-            Test samples.
-
-        Returns
-        -------
-        y:  numpy.ndarray of shape = [n_samples]
-            Predicted class labels class.
-        """
-        # Predict class labels `y`.
-        y_pred = self.predict_proba(X).argmax(axis=1)
-
-        # Re-transform predicted labels using `self.label_encoder_`.
-        y = self.label_encoder_.inverse_transform(y_pred)
-
-        return y
\ No newline at end of file
@@ -1,5 +1,6 @@
 import numpy as np
 
+from scipy.linalg import cho_solve, cholesky, solve_triangular
 from sklearn.base import BaseEstimator, RegressorMixin
 from sklearn.utils import check_array, column_or_1d, check_consistent_length, check_scalar
 
@@ -15,6 +16,13 @@ class GaussianProcessRegression(BaseEstimator, RegressorMixin):
         Specifies the width of the RBF kernel. If None, defaults to 1.0 / n_features.
     alpha: int, default=1
         Prior counts of samples per class.
+    solver: {'cholesky', 'inv'}, default='cholesky'
+        Specifies how the matrix `C_N` is handled. If `solver='cholesky'`, `C_N` is factorized once via a Cholesky
+        decomposition (with a jitter fallback) and predictions are computed via triangular solves. If `solver='inv'`,
+        `C_N` is explicitly inverted.
+    max_jitter_tries: int, default=6
+        Maximum number of attempts to add an increasing jitter to the diagonal of `C_N` if its Cholesky decomposition
+        fails. Only used if `solver='cholesky'`.
 
     Attributes
     ----------
@@ -22,6 +30,15 @@ class GaussianProcessRegression(BaseEstimator, RegressorMixin):
         The sample matrix `X_` is the feature matrix representing the training samples.
     y_: array-like, shape (n_samples) or (n_samples, n_outputs)
         The array `y_` contains the class labels of the training samples.
+    L_: numpy.ndarray, shape (n_samples, n_samples)
+        Lower triangular Cholesky factor of `C_N`. Only available if `solver='cholesky'`.
+    alpha_: numpy.ndarray, shape (n_samples,)
+        Weights `C_N^{-1} y_` of the training samples. Only available if `solver='cholesky'`.
+    jitter_: float
+        Jitter added to the diagonal of `C_N` to obtain its Cholesky decomposition. Only available if
+        `solver='cholesky'`.
+    C_N_inv_: numpy.ndarray, shape (n_samples, n_samples)
+        Inverse of `C_N`. Only available if `solver='inv'`.
 
     References
     ----------
@@ -29,9 +46,11 @@ class GaussianProcessRegression(BaseEstimator, RegressorMixin):
         Proceedings of the Tenth International Workshop Artificial Intelligence and Statistics, 2005.
     """
 
-    def __init__(self, beta=1.e-3, metrics_dict=None):
+    def __init__(self, beta=1.e-3, metrics_dict=None, solver='cholesky', max_jitter_tries=6):
         self.beta = beta
         self.metrics_dict = metrics_dict
+        self.solver = solver
+        self.max_jitter_tries = max_jitter_tries
 
     def fit(self, X, y):
         """
@@ -51,6 +70,9 @@ class GaussianProcessRegression(BaseEstimator, RegressorMixin):
         """
         # Check attributes and parameters.
         check_scalar(self.beta, min_val=0, target_type=float, name='beta')
+        check_scalar(self.max_jitter_tries, min_val=0, target_type=int, name='max_jitter_tries')
+        if self.solver not in ['cholesky', 'inv']:
+            raise ValueError("`solver` must be in `['cholesky', 'inv']`.")
         self.metrics_dict_ = {} if self.metrics_dict is None else self.metrics_dict
         self.X_ = check_array(X)
         self.y_ = column_or_1d(y)
@@ -62,8 +84,69 @@ class GaussianProcessRegression(BaseEstimator, RegressorMixin):
         K = pairwise_kernels(self.X_, **self.metrics_dict_)
         C_N = K + self.beta * np.eye(len(K))
 
-        # Compute inverse `self.C_N_inv_` of matrix `C_N`.
-        self.C_N_inv_ = np.linalg.inv(C_N)
+        if self.solver == 'cholesky':
+            # Factorize `C_N` once and cache the weights `self.alpha_` for the mean predictions.
+            self.L_, self.jitter_ = _cholesky_with_jitter(C_N, max_tries=self.max_jitter_tries)
+            self.alpha_ = cho_solve((self.L_, True), self.y_)
+        else:
+            # Compute inverse `self.C_N_inv_` of matrix `C_N`.
+            self.C_N_inv_ = np.linalg.inv(C_N)
+
+        return self
+
+    def partial_fit(self, X, y):
+        """
+        Add new training samples `X` with labels `y` to an already fitted model. If `solver='cholesky'`, the cached
+        Cholesky factor is extended by a block update, which requires only the kernel values between the new and the
+        already seen samples. Otherwise, or if the model has not been fitted yet, the model is fitted from scratch.
+
+        Parameters
+        ----------
+        X: matrix-like, shape (n_new_samples, n_features)
+            The sample matrix `X` is the feature matrix representing the new samples for training.
+        y: array-like, shape (n_new_samples)
+            The array `y` contains the labels of the new training samples.
+
+        Returns
+        -------
+        self: GaussianProcessRegression,
+            The `GaussianProcessRegression` is fitted on the previous and new training data.
+        """
+        if not hasattr(self, 'X_'):
+            return self.fit(X, y)
+
+        # Check parameters.
+        X = check_array(X)
+        y = column_or_1d(y)
+        check_consistent_length(X, y)
+        self._check_n_features(X, reset=False)
+
+        if self.solver != 'cholesky':
+            return self.fit(np.vstack((self.X_, X)), np.concatenate((self.y_, y)))
+
+        # Compute the new blocks of matrix `C_N`, where the jitter of the already computed factor is reused.
+        K_12 = pairwise_kernels(self.X_, X, **self.metrics_dict_)
+        C_22 = pairwise_kernels(X, **self.metrics_dict_) + (self.beta + self.jitter_) * np.eye(len(X))
+
+        # Extend the Cholesky factor via `[[L_11, 0], [L_21, L_22]]` with `L_21 = (L_11^{-1} K_12)^T` and `L_22` as
+        # Cholesky factor of the Schur complement `C_22 - L_21 L_21^T`.
+        L_21 = solve_triangular(self.L_, K_12, lower=True, check_finite=False).T
+        try:
+            L_22 = cholesky(C_22 - L_21 @ L_21.T, lower=True, check_finite=False)
+        except np.linalg.LinAlgError:
+            # Fall back to a refit, which selects a suitable jitter for the whole matrix `C_N`.
+            return self.fit(np.vstack((self.X_, X)), np.concatenate((self.y_, y)))
+        n_old, n_new = len(self.X_), len(X)
+        L = np.zeros((n_old + n_new, n_old + n_new))
+        L[:n_old, :n_old] = self.L_
+        L[n_old:, :n_old] = L_21
+        L[n_old:, n_old:] = L_22
+
+        # Update training data and cached weights.
+        self.L_ = L
+        self.X_ = np.vstack((self.X_, X))
+        self.y_ = np.concatenate((self.y_, y))
+        self.alpha_ = cho_solve((self.L_, True), self.y_)
 
         return self
 
@@ -89,15 +172,126 @@ class GaussianProcessRegression(BaseEstimator, RegressorMixin):
         # Compute Gram matrix `K` between `X` and `self.X_` using the function
         # `pairwise_kernels` with `self.metric_dict_` as its parameters.
         K = pairwise_kernels(X, self.X_, **self.metrics_dict_)
+        k_diag = _kernel_diag(X, self.metrics_dict_) if return_std else None
+
+        return self.predict_from_kernel(K, k_diag=k_diag, return_std=return_std)
+
+    def predict_from_kernel(self, K, k_diag=None, return_std=False):
+        """
+        Return predictions for test samples whose kernel values have already been computed, e.g., cached across the
+        iterations of a Bayesian optimization.
+
+        Parameters
+        ----------
+        K:  array-like, shape (n_samples, n_train_samples)
+            Gram matrix between the test samples and the training samples `self.X_`.
+        k_diag: array-like, shape (n_samples,), default=None
+            Kernel values `k(x, x)` of the test samples. Required if `return_std=True`.
+
+        Returns
+        -------
+        y:  numpy.ndarray, shape = [n_samples]
+            Predicted class labels class.
+        """
+        # Check parameters.
+        K = check_array(K)
+        if K.shape[1] != len(self.X_):
+            raise ValueError(f"`K` must have {len(self.X_)} columns, got {K.shape[1]}.")
+        return_std = bool(return_std)
+        if return_std:
+            if k_diag is None:
+                raise ValueError("`k_diag` must be given if `return_std=True`.")
+            k_diag = column_or_1d(k_diag)
+            check_consistent_length(K, k_diag)
+
+        if self.solver == 'cholesky':
+            # Compute mean predictions `means` for samples `X`.
+            means = K @ self.alpha_
+
+            if return_std:
+                # Compute standard deviations `stds` for predicted 'means' via a triangular solve, such that only the
+                # row-wise sums of squares of `V` are needed instead of the full matrix `K @ C_N^{-1} @ K.T`.
+                c = k_diag + self.beta
+                V = solve_triangular(self.L_, K.T, lower=True, check_finite=False)
+                stds = np.sqrt(np.maximum(c - np.einsum('ij,ij->j', V, V), 0))
+                return means, stds
+            else:
+                return means
 
         # Compute mean predictions `means` for samples `X`.
         means = K @ self.C_N_inv_ @ self.y_
 
         if return_std:
             # Compute standard deviations `stds` for predicted 'means'.
-            c = np.diag(pairwise_kernels(
-                X, **self.metrics_dict_) + self.beta)
-            stds = np.sqrt(c - np.diag(K @ self.C_N_inv_ @ K.T))
+            c = k_diag + self.beta
+            stds = np.sqrt(np.maximum(c - np.einsum('ij,ij->i', K @ self.C_N_inv_, K), 0))
             return means, stds
         else:
             return means
+
+
+def _kernel_diag(X, metrics_dict=None, chunk_size=1024):
+    """
+    Computes the diagonal of the Gram matrix of `X` without materializing the full Gram matrix.
+
+    Parameters
+    ----------
+    X: array-like, shape (n_samples, n_features)
+        Samples whose kernel values `k(x, x)` are computed.
+    metrics_dict: dict, default=None
+        Parameters passed to the function `pairwise_kernels`.
+    chunk_size: int, default=1024
+        Number of samples whose Gram matrix is computed at once.
+
+    Returns
+    -------
+    k_diag: numpy.ndarray, shape (n_samples,)
+        Diagonal of the Gram matrix of `X`.
+    """
+    metrics_dict = {} if metrics_dict is None else metrics_dict
+    metric = metrics_dict.get('metric', 'linear')
+
+    # Use closed forms for common kernels.
+    if metric in ['rbf', 'laplacian']:
+        return np.ones(len(X))
+    if metric == 'linear':
+        return np.einsum('ij,ij->i', X, X)
+
+    # Otherwise, compute the diagonals of small chunks of the Gram matrix.
+    k_diag = np.empty(len(X))
+    for start in range(0, len(X), chunk_size):
+        X_chunk = X[start:start + chunk_size]
+        k_diag[start:start + chunk_size] = np.diag(pairwise_kernels(X_chunk, **metrics_dict))
+    return k_diag
+
+
+def _cholesky_with_jitter(C, max_tries=6):
+    """
+    Computes the lower triangular Cholesky factor of `C`, adding an increasing jitter to its diagonal if `C` is not
+    numerically positive definite.
+
+    Parameters
+    ----------
+    C: numpy.ndarray, shape (n_samples, n_samples)
+        Symmetric matrix to be factorized.
+    max_tries: int, default=6
+        Maximum number of attempts with increasing jitter.
+
+    Returns
+    -------
+    L: numpy.ndarray, shape (n_samples, n_samples)
+        Lower triangular Cholesky factor of `C + jitter * I`.
+    jitter: float
+        Jitter added to the diagonal of `C`.
+    """
+    base_jitter = 1e-10 * max(np.mean(np.diag(C)), 1e-12) if len(C) else 1e-10
+    jitters = [0.0] + [base_jitter * 10 ** i for i in range(max_tries)]
+    for jitter in jitters:
+        try:
+            L = cholesky(C + jitter * np.eye(len(C)), lower=True, check_finite=False)
+            return L, jitter
+        except np.linalg.LinAlgError:
+            continue
+    raise np.linalg.LinAlgError(
+        f"`C_N` is not positive definite, even after adding a jitter of {jitters[-1]} to its diagonal."
+    )
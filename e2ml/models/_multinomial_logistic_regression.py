@@ -0,0 +1,117 @@
+import numpy as np
+
+from scipy.special import logsumexp, softmax
+
+from sklearn.utils import check_array
+
+from ._base_logistic_regression import _BaseLogisticRegression
+
+
+class MultinomialLogisticRegression(_BaseLogisticRegression):
+    """MultinomialLogisticRegression
+
+    Multinomial logistic regression (MLR) generalizes the binary logistic regression to an arbitrary number of classes
+    by a softmax over one weight vector per class. All classes are optimized jointly, so that each iteration requires
+    a single product of the samples with the weight matrix instead of one pass per class as for one-vs-rest models.
+    Multi-output targets are supported via `sklearn.multioutput.MultiOutputClassifier`.
+
+    Parameters
+    ----------
+    maxiter : int, default=100
+        Maximum number of optimization steps. For the solvers 'sgd' and 'adam', it is the number of epochs, i.e.,
+        passes over the training data.
+    lmbda: float, default=0.0
+        Regularization hyperparameter.
+    solver: {'bfgs', 'lbfgs', 'newton-cg', 'sgd', 'adam'}, default='bfgs'
+        Optimization method, see `BinaryLogisticRegression`. Note that 'bfgs' stores a dense inverse Hessian of shape
+        (n_features * n_classes, n_features * n_classes).
+    learning_rate: {'constant', 'invscaling'}, default='invscaling'
+        Learning rate schedule of the mini-batch steps.
+    learning_rate_init: float, default=0.1
+        Initial learning rate of the mini-batch steps.
+    power_t: float, default=0.5
+        Exponent of the 'invscaling' learning rate schedule.
+    batch_size: int, default=200
+        Number of samples per mini-batch step.
+    random_state: int, RandomState instance or None, default=None
+        Determines the order of the samples in the epochs of the solvers 'sgd' and 'adam'.
+
+
+    Attributes
+    ----------
+    w_: numpy.ndarray, shape (n_features * n_classes,)
+        Flattened weights (parameters) optimized during training the MLR model.
+    W_: numpy.ndarray, shape (n_features, n_classes)
+        View of `w_` as weight matrix, where `W_[:, c]` are the weights of class `c`.
+    t_: int
+        Number of mini-batch steps performed by the solvers 'sgd' and 'adam' or by `partial_fit`.
+    classes_: numpy.ndarray, shape (n_classes,)
+        Class labels known to `label_encoder_`.
+    """
+
+    @property
+    def W_(self):
+        return self.w_.reshape(self.n_features_in_, -1)
+
+    def predict_proba(self, X):
+        """
+        Return probability estimates for the test data `X`.
+
+        Parameters
+        ----------
+        X:  array-like or scipy.sparse matrix of shape (n_samples, n_features)
+            The sample matrix `X` is the feature matrix representing the training samples.
+
+        Returns
+        -------
+        P:  numpy.ndarray of shape (n_samples, n_classes)
+            The class probabilities of the input samples. Classes are ordered by lexicographic order.
+        """
+        # Check `X` parameter.
+        X = check_array(X, accept_sparse=['csr', 'csc'], dtype=[np.float64, np.float32])
+        self._check_n_features(X, reset=False)
+
+        # Estimate and return conditional class probabilities.
+        return softmax(np.asarray(X @ self.W_), axis=1)
+
+    def _init_weights(self, n_features):
+        """
+        Returns the initial flattened weights of all classes.
+        """
+        return np.zeros(n_features * len(self.label_encoder_.classes_))
+
+    def _loss_grad(self, w, X, y):
+        """
+        Computes the regularized softmax cross entropy loss and its gradient with respect to the flattened weights `w`
+        from a single product `X @ W`. The log-normalizers of the logits are evaluated via `logsumexp` to avoid
+        overflows.
+        """
+        W = w.reshape(X.shape[1], -1)
+        Z = np.asarray(X @ W)
+        log_norm = logsumexp(Z, axis=1)
+        rows = np.arange(len(y))
+        loss = np.mean(log_norm - Z[rows, y]) + 0.5 * self.lmbda * (w @ w)
+
+        # The residuals `P - Y` are computed in-place from the logits.
+        Z -= log_norm[:, np.newaxis]
+        np.exp(Z, out=Z)
+        Z[rows, y] -= 1
+        Z /= len(y)
+        gradient = np.asarray(X.T @ Z).ravel()
+        gradient += self.lmbda * w
+        return loss, gradient
+
+    def _curvature(self, w, X):
+        """
+        Computes the class probabilities of the samples, which determine the Hessian.
+        """
+        return softmax(np.asarray(X @ w.reshape(X.shape[1], -1)), axis=1)
+
+    def _hessp(self, curvature, p, X):
+        """
+        Computes the product of the Hessian with the flattened vector `p` without forming the Hessian, where the
+        Hessian block of each sample is `diag(P) - P P^T`.
+        """
+        XV = np.asarray(X @ p.reshape(X.shape[1], -1))
+        R = curvature * (XV - np.sum(curvature * XV, axis=1, keepdims=True))
+        return np.asarray(X.T @ R).ravel() / X.shape[0] + self.lmbda * p
@@ -1,6 +1,8 @@
 import numpy as np
 
+from scipy import sparse as sp
 from sklearn.base import BaseEstimator
+from sklearn.utils import check_array, check_random_state, check_scalar
 
 
 class PrincipalComponentAnalysis(BaseEstimator):
@@ -17,6 +19,18 @@ class PrincipalComponentAnalysis(BaseEstimator):
         select the number of components such that the amount of variance that
         needs to be explained is greater or equal than the percentage specified
         by `n_components`.
+    svd_solver : {'full', 'randomized'}, default='full'
+        If 'full', all eigenvectors of the covariance matrix are computed. If
+        'randomized', only the first `n_components` eigenvectors are
+        approximated by a randomized SVD of the implicitly centered samples,
+        such that sparse samples are never densified. The latter requires an
+        integer `n_components`.
+    n_oversamples : int, default=10
+        Number of additional random vectors used by the randomized SVD.
+    n_iter : int, default=4
+        Number of power iterations used by the randomized SVD.
+    random_state : int, RandomState instance or None, default=None
+        Determines the random vectors of the randomized SVD.
 
     Attributes
     ----------
@@ -25,14 +39,20 @@ class PrincipalComponentAnalysis(BaseEstimator):
     mu_ : numpy.narray, shape (n_features)
         Means of features where mu_[i] is the mean of the i-th feature.
     lmbdas_ : numpy.ndarray, shape (n_features)
-        Eigenvalues, where `lambdas_[i]` is the eigenvalue of the i-th
-        eigenvector.
+        Eigenvalues in decreasing order, where `lambdas_[i]` is the eigenvalue
+        of the i-th eigenvector. Only the first `n_components_` eigenvalues are
+        computed if `svd_solver='randomized'`.
     U_ : numpy.ndarray, shape (n_features, n_features)
         Sorted eigenvector matrix where `U_[:, i]` is the i-th eigenvector
-        with the i-th highest eigenvalue.
+        with the i-th highest eigenvalue. Only the first `n_components_`
+        eigenvectors are computed if `svd_solver='randomized'`.
     """
-    def __init__(self, n_components):
+    def __init__(self, n_components, svd_solver='full', n_oversamples=10, n_iter=4, random_state=None):
         self.n_components = n_components
+        self.svd_solver = svd_solver
+        self.n_oversamples = n_oversamples
+        self.n_iter = n_iter
+        self.random_state = random_state
 
     def fit(self, X):
         """
@@ -40,7 +60,7 @@ class PrincipalComponentAnalysis(BaseEstimator):
 
         Parameters
         ----------
-        X : array-like, shape (n_samples, n_features)
+        X : array-like or scipy.sparse matrix, shape (n_samples, n_features)
             Input samples.
 
         Returns
@@ -48,24 +68,47 @@ class PrincipalComponentAnalysis(BaseEstimator):
         self : PrincipalComponentAnalysis
             The fitted PrincipalComponentAnalysis object.
         """
-        # Transform to numpy.ndarray.
-        X = np.array(X)
+        # Transform to numpy.ndarray or sparse matrix of float32 or float64 values.
+        if self.svd_solver not in ['full', 'randomized']:
+            raise ValueError("`svd_solver` must be in `['full', 'randomized']`.")
+        X = check_array(X, accept_sparse=['csr', 'csc'], dtype=[np.float64, np.float32])
 
         # Number of samples.
         n_samples = X.shape[0]
 
         # Compute mean `self.mu_` of each feature, which is zero if samples have been
         # standardized.
-        self.mu_ = np.mean(X, axis=0)
+        self.mu_ = np.asarray(X.mean(axis=0), dtype=X.dtype).ravel()
+
+        if self.svd_solver == 'randomized':
+            check_scalar(self.n_components, name='n_components', target_type=int, min_val=1,
+                         max_val=min(X.shape))
+            check_scalar(self.n_oversamples, name='n_oversamples', target_type=int, min_val=0)
+            check_scalar(self.n_iter, name='n_iter', target_type=int, min_val=0)
+            self.n_components_ = self.n_components
+            s, self.U_ = _randomized_svd(
+                X, self.mu_, self.n_components, self.n_oversamples, self.n_iter, self.random_state
+            )
+            self.lmbdas_ = s ** 2 / n_samples
+            return self
 
         # Compute DxD covariance matrix `S` (take mean into account).
-        S = ((X - self.mu_).T @ (X - self.mu_)) / n_samples
+        if sp.issparse(X):
+            # Center implicitly to keep sparse matrices sparse, where the Gram matrix is
+            # accumulated in float64 to limit the cancellation of `E[x x^T] - mu mu^T`.
+            X_64 = X.astype(np.float64)
+            mu_64 = np.asarray(X_64.mean(axis=0)).ravel()
+            S = (X_64.T @ X_64).toarray() / n_samples - np.outer(mu_64, mu_64)
+            S = S.astype(X.dtype, copy=False)
+        else:
+            S = ((X - self.mu_).T @ (X - self.mu_)) / n_samples
 
         # Compute eigenvalues `self.lmbdas_` and eigenvectors `self.U_`.
         self.lmbdas_, self.U_ = np.linalg.eigh(S)
 
-        # Sort eigenvalues and eigenvectors in decreasing order.
-        # Already done by np.linalg.eigh().
+        # Sort eigenvalues and eigenvectors in decreasing order, since `np.linalg.eigh`
+        # returns them in increasing order.
+        self.lmbdas_, self.U_ = self.lmbdas_[::-1], self.U_[:, ::-1]
 
         # Determine number of selected components.
         self._determine_M()
@@ -79,7 +122,7 @@ class PrincipalComponentAnalysis(BaseEstimator):
 
         Parameters
         ----------
-        X : numpy.ndarray, sahpe (n_samples, n_features)
+        X : numpy.ndarray or scipy.sparse matrix, sahpe (n_samples, n_features)
             Samples in the input space.
 
         Returns
@@ -88,8 +131,9 @@ class PrincipalComponentAnalysis(BaseEstimator):
             Transformed samples in the projection space.
         """
         B = self.U_[:, :self.n_components_]
-        X = np.array(X)
-        return (X - self.mu_) @ B
+        X = check_array(X, accept_sparse=['csr', 'csc'], dtype=[np.float64, np.float32])
+        # Centering after the projection avoids densifying sparse matrices.
+        return np.asarray(X @ B) - self.mu_ @ B
 
     def inverse_transform(self, Z):
         """
@@ -107,7 +151,7 @@ class PrincipalComponentAnalysis(BaseEstimator):
             Re-transformed samples in the input space.
         """
         B = self.U_[:, :self.n_components_]
-        Z = np.array(Z)
+        Z = check_array(Z, dtype=[np.float64, np.float32])
         return (Z @ B.T) + self.mu_
 
     def _determine_M(self):
@@ -129,4 +173,32 @@ class PrincipalComponentAnalysis(BaseEstimator):
             self.n_components_ = np.argmax(np.cumsum(self.lmbdas_ / np.sum(self.lmbdas_)) >= self.n_components) + 1
             return
         else:
-            raise ValueError('Invalid `n_components` parameter.')
\ No newline at end of file
+            raise ValueError('Invalid `n_components` parameter.')
+
+
+def _randomized_svd(X, mu, n_components, n_oversamples, n_iter, random_state):
+    """
+    Approximates the first `n_components` singular values and right singular vectors of the centered matrix
+    `X - mu` via a randomized range finder with power iterations. The centering is applied implicitly to the
+    products with `X`, such that only matrices of shape (n_samples, n_components + n_oversamples) and
+    (n_features, n_components + n_oversamples) are allocated.
+    """
+    random_state = check_random_state(random_state)
+    n_random = min(n_components + n_oversamples, min(X.shape))
+
+    def matmat(Q):
+        return np.asarray(X @ Q) - mu @ Q
+
+    def rmatmat(Q):
+        return np.asarray(X.T @ Q) - np.outer(mu, Q.sum(axis=0))
+
+    # Find an orthonormal basis `Q` approximating the range of the centered matrix.
+    Q = matmat(random_state.normal(size=(X.shape[1], n_random)).astype(X.dtype, copy=False))
+    Q, _ = np.linalg.qr(Q)
+    for _ in range(n_iter):
+        Q, _ = np.linalg.qr(rmatmat(Q))
+        Q, _ = np.linalg.qr(matmat(Q))
+
+    # Compute the SVD of the small projected matrix `Q.T @ (X - mu)`.
+    _, s, Vt = np.linalg.svd(rmatmat(Q).T, full_matrices=False)
+    return s[:n_components], Vt[:n_components].T
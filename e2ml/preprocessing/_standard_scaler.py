@@ -1,6 +1,9 @@
 import numpy as np
 
+from scipy import sparse as sp
 from sklearn.base import BaseEstimator
+from sklearn.utils import check_array
+from sklearn.utils.sparsefuncs import mean_variance_axis
 
 
 class StandardScaler(BaseEstimator):
@@ -8,21 +11,31 @@ class StandardScaler(BaseEstimator):
 
     Standardize features by removing the mean and scaling to unit variance.
 
+    Parameters
+    ----------
+    with_mean : bool, default=True
+        If True, the data is centered before scaling. Sparse matrices are only supported for `with_mean=False`,
+        because centering would make them dense.
+
     Attributes
     ----------
     mu_ : numpy.ndarray, shape (n_features)
         The mean value for each feature in the training set.
     sigma_ : numpy.ndarray, shape (n_features)
-        The standard deviation for each feature in the training set.
+        The standard deviation for each feature in the training set. Features with zero standard deviation are
+        mapped to zero.
     """
 
+    def __init__(self, with_mean=True):
+        self.with_mean = with_mean
+
     def fit(self, X):
         """
         Determine required parameters to standardize data.
 
         Parameters
         ----------
-        X : array-like, shape (n_samples, n_features)
+        X : array-like or scipy.sparse matrix, shape (n_samples, n_features)
             Input samples.
 
         Returns
@@ -30,8 +43,15 @@ class StandardScaler(BaseEstimator):
         self : StandardScaler
             The fitted StandardScaler object.
         """
-        # Transform to numpy.ndarray.
-        X = np.array(X)
+        # Transform to numpy.ndarray or sparse matrix of float32 or float64 values.
+        X = self._check_X(X)
+
+        if sp.issparse(X):
+            # Compute the means and variances from the non-zero entries.
+            self.mu_, var = mean_variance_axis(X, axis=0)
+            self.mu_ = self.mu_.astype(X.dtype, copy=False)
+            self.sigma_ = np.sqrt(var).astype(X.dtype, copy=False)
+            return self
 
         # Compute `self.mu_` containing the mean value for each feature in the training set.
         self.mu_ = np.mean(X, axis=0)
@@ -47,19 +67,23 @@ class StandardScaler(BaseEstimator):
 
         Parameters
         ----------
-        X : array-like, shape (n_samples, n_features)
+        X : array-like or scipy.sparse matrix, shape (n_samples, n_features)
             Input samples.
 
         Returns
         -------
-        Z : numpy.ndarray, shape (n_samples, n_features)
+        Z : numpy.ndarray or scipy.sparse matrix, shape (n_samples, n_features)
             Standardized samples.
         """
-        # Transform to numpy.ndarray.
-        X = np.array(X)
+        # Transform to numpy.ndarray or sparse matrix of float32 or float64 values.
+        X = self._check_X(X)
 
-        # Standardize data by computing `Z`.
-        Z = np.nan_to_num((X - self.mu_) / self.sigma_)
+        # Standardize data by computing `Z`, where the sparsity pattern of sparse matrices is kept.
+        scale = np.divide(1, self.sigma_, out=np.zeros_like(self.sigma_), where=self.sigma_ > 0)
+        if sp.issparse(X):
+            return (X @ sp.diags(scale)).asformat(X.format)
+        Z = X - self.mu_ if self.with_mean else X.copy()
+        Z *= scale
 
         return Z
 
@@ -69,18 +93,31 @@ class StandardScaler(BaseEstimator):
 
         Parameters
         ----------
-        Z : array-like, shape (n_samples, n_features)
+        Z : array-like or scipy.sparse matrix, shape (n_samples, n_features)
             Standardized samples.
 
         Returns
         -------
-        X : numpy.ndarray, shape (n_samples, n_features)
+        X : numpy.ndarray or scipy.sparse matrix, shape (n_samples, n_features)
             Re-scaled samples.
         """
-        # Transform to numpy.ndarray.
-        Z = np.array(Z)
+        # Transform to numpy.ndarray or sparse matrix of float32 or float64 values.
+        Z = self._check_X(Z)
 
         # Re-scale samples to original space by computing `X`.
-        X = Z * self.sigma_ + self.mu_
+        if sp.issparse(Z):
+            return (Z @ sp.diags(self.sigma_)).asformat(Z.format)
+        X = Z * self.sigma_
+        if self.with_mean:
+            X += self.mu_
 
+        return X
+
+    def _check_X(self, X):
+        """
+        Checks the samples `X` without converting float32 values or sparse matrices.
+        """
+        X = check_array(X, accept_sparse=['csr', 'csc'], dtype=[np.float64, np.float32])
+        if sp.issparse(X) and self.with_mean:
+            raise ValueError("Sparse matrices cannot be centered, use `with_mean=False` instead.")
         return X
\ No newline at end of file